@@ -1,6 +1,6 @@
 """AI Collaboration Tool - Agile-style PM + Developer AI teamwork"""
 
-from .ai_clients import AIClient, OpenAIClient, AnthropicClient, create_client, Message
+from .ai_clients import AIClient, OpenAIClient, AnthropicClient, create_client, Message, Usage, cacheable_user
 from .workflow import CollaborationWorkflow, WorkflowResult, WorkflowPhase, TaskType
 
 __version__ = "1.0.0"
@@ -10,6 +10,8 @@ __all__ = [
     "AnthropicClient",
     "create_client",
     "Message",
+    "Usage",
+    "cacheable_user",
     "CollaborationWorkflow",
     "WorkflowResult",
     "WorkflowPhase",
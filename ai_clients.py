@@ -1,82 +1,473 @@
 """AI Client modules for OpenAI and Anthropic"""
 
+import asyncio
+import atexit
+import hashlib
 import os
-from abc import ABC, abstractmethod
+import re
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterator, Protocol
 
-from openai import OpenAI
-from anthropic import Anthropic
+from openai import AsyncOpenAI, OpenAI
+from anthropic import Anthropic, AsyncAnthropic
+
+# Anthropic only caches prefixes of at least this many tokens
+MIN_CACHEABLE_TOKENS = 1024
 
 
 @dataclass
 class Message:
     role: str
     content: str
+    cache: bool = False  # Mark as a stable prefix block (prompt caching)
+
+
+@dataclass
+class Usage:
+    """Token usage reported by the provider for a single call"""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cost: float = 0.0  # USD, when the provider reports it (e.g. OpenAI-compatible gateways)
+    first_token_latency: float = 0.0  # Seconds until the first streamed text; 0 if not measured
+
+
+def cacheable_user(prefix: str, tail: str = "") -> list[Message]:
+    """Split a user prompt into a cached stable prefix and a variable tail"""
+    messages = [Message(role="user", content=prefix, cache=True)]
+    if tail:
+        messages.append(Message(role="user", content=tail))
+    return messages
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Stable routing key so calls sharing a system prompt hit the same OpenAI cache"""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:32]
+
+
+# Workflows send the same few system prompts on every call, so their formatted forms
+# are built once and shared between requests (the SDKs never mutate them)
+@lru_cache(maxsize=32)
+def _openai_system_message(system_prompt: str) -> dict:
+    return {"role": "system", "content": system_prompt}
+
+
+@lru_cache(maxsize=32)
+def _anthropic_system(system_prompt: str, enable_cache: bool):
+    """System prompt as a cached block when it is long enough, otherwise the plain string"""
+    if enable_cache and len(system_prompt) // 4 >= MIN_CACHEABLE_TOKENS:
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    return system_prompt
+
+
+_by_role = attrgetter("role")
+
+
+def _estimate_prompt_tokens(messages: list[Message], system_prompt: str) -> int:
+    """Rough prompt size (~4 characters per token) for streams cut before usage arrives"""
+    return (len(system_prompt) + sum(len(msg.content) for msg in messages)) // 4
+
+
+# Shared SDK clients keyed by (provider, api_key, base_url) so every workflow reuses
+# one connection pool (keep-alive, warm TLS) instead of building fresh HTTP state.
+# Each SDK builds its own pooled HTTP client: they pin different httpx flavours
+# (anthropic>=1 uses httpx2), so a shared httpx.Client is not portable across them
+_shared_clients: dict[tuple, object] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(provider: str, api_key: str, base_url: str = None):
+    """Return the process-wide SDK client for these credentials, creating it once"""
+    key = (provider, api_key, base_url)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            sdk_class = OpenAI if provider == "openai" else Anthropic
+            client = sdk_class(api_key=api_key, base_url=base_url)
+            _shared_clients[key] = client
+        return client
+
+
+@atexit.register
+def _close_shared_clients():
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
+
+
+@lru_cache(maxsize=None)
+def _marker_pattern(marker: str) -> re.Pattern:
+    return re.compile(re.escape(marker), re.IGNORECASE)
+
+
+class _MarkerScanner:
+    """Case-insensitive marker search over streamed chunks, keeping a small overlap tail"""
+
+    def __init__(self, marker: str):
+        self.pattern = _marker_pattern(marker)
+        self.overlap = len(marker) - 1
+        self.tail = ""
+
+    def feed(self, text: str) -> bool:
+        window = self.tail + text
+        if self.pattern.search(window):
+            return True
+        self.tail = window[-self.overlap:] if self.overlap else ""
+        return False
+
+
+class AIClient(Protocol):
+    """Interface for AI clients; subclass it to get the async helpers"""
 
+    __slots__ = ("_semaphore", "_semaphore_loop")
 
-class AIClient(ABC):
-    """Base class for AI clients"""
+    max_concurrency: int = 4
 
-    @abstractmethod
-    def chat(self, messages: list[Message], system_prompt: str = "") -> str:
-        pass
+    def chat(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None
+    ) -> tuple[str, Usage]:
+        """Send a chat request.
+
+        If stop_marker is given, the response is streamed and the request is closed
+        as soon as the marker appears, so no further output tokens are generated.
+        """
+        ...
+
+    def stream_chat(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> Iterator[str]:
+        """Yield response text as it arrives, filling usage in place.
+
+        Stops after the chunk containing stop_marker; closing the iterator early
+        aborts the request. This default yields the whole blocking response at once.
+        """
+        text, result = self.chat(messages, system_prompt, stop_marker)
+        if usage is not None:
+            vars(usage).update(vars(result))
+        yield text
+
+    async def chat_async(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> tuple[str, Usage]:
+        """Async chat; falls back to running the blocking call in a worker thread.
+
+        usage is filled in place, so a cancelled call still reports what it was billed
+        for: prompt_tokens starts as an estimate once the request is sent and is
+        replaced by the provider's counts.
+        """
+        usage = usage if usage is not None else Usage()
+        async with self._get_semaphore():
+            usage.prompt_tokens = _estimate_prompt_tokens(messages, system_prompt)
+            text, result = await asyncio.to_thread(self.chat, messages, system_prompt, stop_marker)
+            vars(usage).update(vars(result))
+            return text, usage
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency guard bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if getattr(self, "_semaphore_loop", None) is not loop:
+            # Async SDK clients hold connections bound to one loop, so recreate them too
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+            self.async_client = None
+        return self._semaphore
 
 
 class OpenAIClient(AIClient):
     """OpenAI API Client (Manager/PM role)"""
 
-    def __init__(self, api_key: str = None, model: str = "gpt-4o", temperature: float = 0.3):
+    provider = "openai"
+
+    # "chat" is a slot holding the pre-bound _chat_impl, so calls skip the class lookup
+    __slots__ = (
+        "api_key", "base_url", "client", "async_client", "model", "temperature",
+        "max_concurrency", "max_retries", "chat",
+    )
+
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4o",
+        temperature: float = 0.3,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_url: str = None,
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
-        self.client = OpenAI(api_key=self.api_key)
+        self.base_url = base_url
+        # with_options copies the client but keeps the shared connection pool
+        self.client = _get_shared_client("openai", self.api_key, base_url).with_options(max_retries=max_retries)
+        self.async_client = None
         self.model = model
         self.temperature = temperature
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.chat = self._chat_impl
 
-    def chat(self, messages: list[Message], system_prompt: str = "") -> str:
-        formatted_messages = []
+    def _build_request(self, messages: list[Message], system_prompt: str) -> dict:
+        # Consecutive same-role parts (e.g. from cacheable_user) are sent as one message;
+        # OpenAI caches identical prefixes automatically
+        formatted_messages = [_openai_system_message(system_prompt)] if system_prompt else []
+        formatted_messages.extend(
+            {"role": role, "content": "".join(msg.content for msg in group)}
+            for role, group in groupby(messages, key=_by_role)
+        )
 
+        kwargs = {}
         if system_prompt:
-            formatted_messages.append({"role": "system", "content": system_prompt})
-
-        for msg in messages:
-            formatted_messages.append({"role": msg.role, "content": msg.content})
+            # Sent via extra_body so older SDK versions without the parameter still work
+            kwargs["extra_body"] = {"prompt_cache_key": _prompt_cache_key(system_prompt)}
 
-        response = self.client.chat.completions.create(
+        return dict(
             model=self.model,
             messages=formatted_messages,
             temperature=self.temperature,
+            **kwargs,
         )
 
-        return response.choices[0].message.content
+    def _build_stream_request(self, messages: list[Message], system_prompt: str) -> dict:
+        request = self._build_request(messages, system_prompt)
+        request["stream"] = True
+        request.setdefault("extra_body", {})["stream_options"] = {"include_usage": True}
+        return request
+
+    @staticmethod
+    def _parse_usage(raw_usage, usage: Usage = None) -> Usage:
+        usage = usage or Usage()
+        if raw_usage:
+            usage.prompt_tokens = raw_usage.prompt_tokens
+            usage.completion_tokens = raw_usage.completion_tokens
+            details = getattr(raw_usage, "prompt_tokens_details", None)
+            usage.cache_read_input_tokens = getattr(details, "cached_tokens", None) or 0
+            usage.cost = getattr(raw_usage, "cost", None) or 0.0
+        return usage
+
+    def _parse_response(self, response) -> tuple[str, Usage]:
+        return response.choices[0].message.content, self._parse_usage(response.usage)
+
+    def _consume_chunk(self, chunk, parts: list[str], usage: Usage, scanner: _MarkerScanner | None) -> bool:
+        """Collect one stream chunk into parts/usage; returns True once the marker is seen"""
+        if getattr(chunk, "usage", None):
+            self._parse_usage(chunk.usage, usage)
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            return False
+        delta = chunk.choices[0].delta.content
+        parts.append(delta)
+        usage.completion_tokens += 1  # One content delta per token; replaced by reported usage
+        return scanner is not None and scanner.feed(delta)
+
+    def _chat_impl(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None
+    ) -> tuple[str, Usage]:
+        if not stop_marker:
+            response = self.client.chat.completions.create(**self._build_request(messages, system_prompt))
+            return self._parse_response(response)
+
+        usage = Usage()
+        return "".join(self.stream_chat(messages, system_prompt, stop_marker, usage)), usage
+
+    def stream_chat(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> Iterator[str]:
+        parts, usage = [], usage if usage is not None else Usage()
+        scanner = _MarkerScanner(stop_marker) if stop_marker else None
+        stream = self.client.chat.completions.create(**self._build_stream_request(messages, system_prompt))
+        try:
+            for chunk in stream:
+                received = len(parts)
+                stop = self._consume_chunk(chunk, parts, usage, scanner)
+                if len(parts) > received:
+                    yield parts[-1]
+                if stop:
+                    break
+        finally:
+            stream.close()
+            # Usage only comes in the final chunk; a stream stopped early was still billed for its prompt
+            if not usage.prompt_tokens:
+                usage.prompt_tokens = _estimate_prompt_tokens(messages, system_prompt)
+
+    async def chat_async(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> tuple[str, Usage]:
+        # The SDK retries rate-limit/connection errors with backoff and honors retry-after
+        usage = usage if usage is not None else Usage()
+        async with self._get_semaphore():
+            if self.async_client is None:
+                self.async_client = AsyncOpenAI(
+                    api_key=self.api_key, base_url=self.base_url, max_retries=self.max_retries
+                )
+
+            # Replaced by reported usage, which a cancelled or marker-stopped stream never receives
+            usage.prompt_tokens = _estimate_prompt_tokens(messages, system_prompt)
+            if not stop_marker:
+                response = await self.async_client.chat.completions.create(
+                    **self._build_request(messages, system_prompt)
+                )
+                text, result = self._parse_response(response)
+                vars(usage).update(vars(result))
+                return text, usage
+
+            parts, scanner = [], _MarkerScanner(stop_marker)
+            stream = await self.async_client.chat.completions.create(
+                **self._build_stream_request(messages, system_prompt)
+            )
+            try:
+                async for chunk in stream:
+                    if self._consume_chunk(chunk, parts, usage, scanner):
+                        break
+            finally:
+                await stream.close()
+            return "".join(parts), usage
 
 
 class AnthropicClient(AIClient):
     """Anthropic Claude API Client (Developer role)"""
 
-    def __init__(self, api_key: str = None, model: str = "claude-sonnet-4-20250514", temperature: float = 0.7):
+    provider = "anthropic"
+
+    # "chat" is a slot holding the pre-bound _chat_impl, so calls skip the class lookup
+    __slots__ = (
+        "api_key", "base_url", "client", "async_client", "model", "temperature",
+        "enable_cache", "max_concurrency", "max_retries", "chat",
+    )
+
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "claude-sonnet-4-20250514",
+        temperature: float = 0.7,
+        enable_cache: bool = True,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_url: str = None,
+    ):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key is required")
-        self.client = Anthropic(api_key=self.api_key)
+        self.base_url = base_url
+        # with_options copies the client but keeps the shared connection pool
+        self.client = _get_shared_client("anthropic", self.api_key, base_url).with_options(max_retries=max_retries)
+        self.async_client = None
         self.model = model
         self.temperature = temperature
+        self.enable_cache = enable_cache
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.chat = self._chat_impl
+
+    def _format_system(self, system_prompt: str):
+        """Format the system prompt, as a cached block when it is long enough"""
+        if not system_prompt:
+            return ""
+        return _anthropic_system(system_prompt, self.enable_cache)
+
+    def _format_block(self, msg: Message) -> dict:
+        if msg.cache and self.enable_cache:
+            return {"type": "text", "text": msg.content, "cache_control": {"type": "ephemeral"}}
+        return {"type": "text", "text": msg.content}
 
-    def chat(self, messages: list[Message], system_prompt: str = "") -> str:
-        formatted_messages = []
+    def _format_messages(self, messages: list[Message]) -> list[dict]:
+        """Format messages, merging consecutive same-role messages into content blocks"""
+        return [
+            {"role": role, "content": [self._format_block(msg) for msg in group]}
+            for role, group in groupby(messages, key=_by_role)
+        ]
 
-        for msg in messages:
-            formatted_messages.append({"role": msg.role, "content": msg.content})
+    def _build_request(self, messages: list[Message], system_prompt: str) -> dict:
+        kwargs = {}
+        if self.enable_cache:
+            # Only needed by older API versions, ignored once caching is GA
+            kwargs["extra_headers"] = {"anthropic-beta": "prompt-caching-2024-07-31"}
 
-        response = self.client.messages.create(
+        return dict(
             model=self.model,
             max_tokens=4096,
-            system=system_prompt if system_prompt else "",
-            messages=formatted_messages,
+            system=self._format_system(system_prompt),
+            messages=self._format_messages(messages),
             temperature=self.temperature,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _parse_usage(raw_usage, usage: Usage = None) -> Usage:
+        usage = usage or Usage()
+        # input_tokens excludes cached prefix tokens, so add them back for the total
+        usage.cache_creation_input_tokens = getattr(raw_usage, "cache_creation_input_tokens", None) or 0
+        usage.cache_read_input_tokens = getattr(raw_usage, "cache_read_input_tokens", None) or 0
+        usage.prompt_tokens = (
+            (raw_usage.input_tokens or 0) + usage.cache_creation_input_tokens + usage.cache_read_input_tokens
         )
+        usage.completion_tokens = raw_usage.output_tokens or 0
+        return usage
+
+    def _consume_event(
+        self, event, parts: list[str], usage: Usage, scanner: _MarkerScanner | None, started: float
+    ) -> bool:
+        """Collect one stream event into parts/usage; returns True once the marker is seen"""
+        if event.type == "message_start":
+            self._parse_usage(event.message.usage, usage)
+        elif event.type == "message_delta":
+            usage.completion_tokens = event.usage.output_tokens
+        elif event.type == "content_block_delta" and getattr(event.delta, "text", None):
+            if not parts:
+                usage.first_token_latency = time.perf_counter() - started
+            parts.append(event.delta.text)
+            usage.completion_tokens += 1  # Approximate until message_delta reports the total
+            return scanner is not None and scanner.feed(event.delta.text)
+        return False
+
+    def _chat_impl(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None
+    ) -> tuple[str, Usage]:
+        # Always stream: text arrives incrementally and the first-token latency is measured
+        usage = Usage()
+        return "".join(self.stream_chat(messages, system_prompt, stop_marker, usage)), usage
+
+    def stream_chat(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> Iterator[str]:
+        parts, usage = [], usage if usage is not None else Usage()
+        scanner = _MarkerScanner(stop_marker) if stop_marker else None
+        started = time.perf_counter()
+        with self.client.messages.stream(**self._build_request(messages, system_prompt)) as stream:
+            for event in stream:
+                received = len(parts)
+                stop = self._consume_event(event, parts, usage, scanner, started)
+                if len(parts) > received:
+                    yield parts[-1]
+                if stop:
+                    break
+
+    async def chat_async(
+        self, messages: list[Message], system_prompt: str = "", stop_marker: str = None, usage: Usage = None
+    ) -> tuple[str, Usage]:
+        # The SDK retries rate-limit/connection errors with backoff and honors retry-after
+        async with self._get_semaphore():
+            if self.async_client is None:
+                self.async_client = AsyncAnthropic(
+                    api_key=self.api_key, base_url=self.base_url, max_retries=self.max_retries
+                )
 
-        return response.content[0].text
+            # message_start replaces the estimate with the real input count
+            parts, usage = [], usage if usage is not None else Usage()
+            usage.prompt_tokens = _estimate_prompt_tokens(messages, system_prompt)
+            scanner = _MarkerScanner(stop_marker) if stop_marker else None
+            started = time.perf_counter()
+            async with self.async_client.messages.stream(**self._build_request(messages, system_prompt)) as stream:
+                async for event in stream:
+                    if self._consume_event(event, parts, usage, scanner, started):
+                        break
+            return "".join(parts), usage
 
 
 def create_client(provider: str, **kwargs) -> AIClient:
@@ -1,34 +1,76 @@
 #!/usr/bin/env python3
 """AI Collaboration CLI - Agile-style AI teamwork tool"""
 
+import asyncio
+import json
 import os
 import sys
+from typing import TYPE_CHECKING
 
 import click
-import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Prompt
 
-from ai_clients import create_client
-from workflow import CollaborationWorkflow
+# ai_clients/workflow pull in the openai/anthropic SDKs; they are imported lazily
+# in create_workflow() so --help and config-only paths start quickly
+if TYPE_CHECKING:
+    from workflow import CollaborationWorkflow
 
 console = Console()
 
 
+def _prompt():
+    """Lazily import rich's Prompt (only interactive paths need it)"""
+    from rich.prompt import Prompt
+    return Prompt
+
+
+def _load_yaml(f) -> dict:
+    """Parse YAML, preferring libyaml's C parser over the pure-Python one"""
+    import yaml
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    return yaml.load(f, Loader=loader)
+
+
 def load_config(config_path: str = None) -> dict:
     """Load configuration from YAML file"""
     if config_path is None:
         config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
 
-    if os.path.exists(config_path):
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    return {}
+    if not os.path.exists(config_path):
+        return {}
+
+    # Parsed config is cached as JSON next to the YAML, keyed by the YAML's mtime
+    cache_path = config_path + ".json"
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("mtime_ns") == mtime_ns:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
 
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = _load_yaml(f)
 
-def create_workflow(config: dict) -> CollaborationWorkflow:
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": mtime_ns, "config": config}, f)
+    except (OSError, TypeError, ValueError):
+        pass  # Cache is best-effort (read-only dirs, non-JSON values)
+
+    return config
+
+
+def create_workflow(config: dict) -> "CollaborationWorkflow":
     """Create workflow from config"""
+    from ai_clients import create_client
+    from workflow import CollaborationWorkflow
+
     models = config.get("models", {})
     workflow_config = config.get("workflow", {})
 
@@ -36,16 +78,19 @@ def create_workflow(config: dict) -> CollaborationWorkflow:
     developer_config = models.get("developer", {})
 
     # Create clients
+    max_concurrency = workflow_config.get("max_concurrency", 4)
     manager_client = create_client(
         provider=manager_config.get("provider", "openai"),
         model=manager_config.get("model", "gpt-4o"),
         temperature=manager_config.get("temperature", 0.3),
+        max_concurrency=max_concurrency,
     )
 
     developer_client = create_client(
         provider=developer_config.get("provider", "anthropic"),
         model=developer_config.get("model", "claude-sonnet-4-20250514"),
         temperature=developer_config.get("temperature", 0.7),
+        max_concurrency=max_concurrency,
     )
 
     return CollaborationWorkflow(
@@ -59,7 +104,17 @@ def create_workflow(config: dict) -> CollaborationWorkflow:
         checkpoint_interval=workflow_config.get("checkpoint_interval"),
         max_no_progress=workflow_config.get("max_no_progress", 3),
         early_stop_similarity=workflow_config.get("early_stop_similarity", 0.95),
+        similarity_window=workflow_config.get("similarity_window", 2048),
+        revise_diff_ratio=workflow_config.get("revise_diff_ratio", 0.5),
         budget_mode=workflow_config.get("budget_mode", "balanced"),
+        response_cache=workflow_config.get("response_cache", False),
+        cache_ttl=workflow_config.get("cache_ttl", 86400),
+        semantic_cache=workflow_config.get("semantic_cache", False),
+        semantic_threshold=workflow_config.get("semantic_threshold", 0.97),
+        max_concurrent_reviews=workflow_config.get("max_concurrent_reviews", 3),
+        max_history_turns=workflow_config.get("max_history_turns"),
+        verbose_markdown=workflow_config.get("verbose_markdown", False),
+        live_output=workflow_config.get("live_output", True),
     )
 
 
@@ -75,9 +130,15 @@ def cli(ctx, config):
 @cli.command()
 @click.argument("requirements", required=False)
 @click.option("--file", "-f", type=click.Path(exists=True), help="Read requirements from file")
+@click.option("--parallel-review", is_flag=True, help="Review each submission with parallel critics")
+@click.option("--resume", is_flag=True, help="Resume from the last checkpoint for these requirements")
+@click.option("--resume-from", "resume_log", type=click.Path(exists=True), help="Resume from a run log (run_*.jsonl[.tmp])")
 @click.pass_context
-def develop(ctx, requirements, file):
+def develop(ctx, requirements, file, parallel_review, resume, resume_log):
     """Run development workflow with PM review loop"""
+    if parallel_review and (resume or resume_log):
+        raise click.UsageError("--resume/--resume-from cannot be combined with --parallel-review")
+
     if file:
         with open(file, "r", encoding="utf-8") as f:
             requirements = f.read()
@@ -97,7 +158,10 @@ def develop(ctx, requirements, file):
 
     try:
         workflow = create_workflow(ctx.obj["config"])
-        result = workflow.run_development(requirements)
+        if parallel_review:
+            result = asyncio.run(workflow.run_development_async(requirements))
+        else:
+            result = workflow.run_development(requirements, resume=resume, resume_log=resume_log)
 
         console.print("\n")
         if result.success:
@@ -119,8 +183,9 @@ def develop(ctx, requirements, file):
 @cli.command()
 @click.option("--file", "-f", type=click.Path(exists=True), help="Code file to review")
 @click.option("--context", "-x", default="", help="Additional context for review")
+@click.option("--parallel-review", is_flag=True, help="Review each revision with parallel critics")
 @click.pass_context
-def review(ctx, file, context):
+def review(ctx, file, context, parallel_review):
     """Run code review workflow"""
     if file:
         with open(file, "r", encoding="utf-8") as f:
@@ -141,7 +206,10 @@ def review(ctx, file, context):
 
     try:
         workflow = create_workflow(ctx.obj["config"])
-        result = workflow.run_review(code, context)
+        if parallel_review:
+            result = asyncio.run(workflow.run_review_async(code, context))
+        else:
+            result = workflow.run_review(code, context)
 
         console.print("\n")
         if result.success:
@@ -215,7 +283,7 @@ def docs(ctx, topic, context, file):
         with open(file, "r", encoding="utf-8") as f:
             topic = f.read()
     elif not topic:
-        topic = Prompt.ask("[bold blue]What would you like to document?[/]")
+        topic = _prompt().ask("[bold blue]What would you like to document?[/]")
 
     if not topic:
         console.print("[red]No topic provided[/]")
@@ -259,7 +327,7 @@ def interactive(ctx):
         title="Welcome"
     ))
 
-    workflow_type = Prompt.ask(
+    workflow_type = _prompt().ask(
         "\n[bold]Select workflow type[/]",
         choices=["develop", "review", "plan", "docs", "quit"],
         default="develop"
@@ -1,21 +1,71 @@
 from .manager import (
     MANAGER_SYSTEM_PROMPT,
+    MANAGER_REVIEW_HEADER,
+    MANAGER_REVIEW_TAIL,
     MANAGER_REVIEW_PROMPT,
+    MANAGER_PLANNING_HEADER,
+    MANAGER_PLANNING_TAIL,
     MANAGER_PLANNING_PROMPT,
+    MANAGER_CRITIC_PROMPTS,
+    render_review_header,
+    render_review_tail,
+    render_planning_header,
+    render_planning_tail,
 )
 from .developer import (
     DEVELOPER_SYSTEM_PROMPT,
+    DEVELOPER_DOC_SYSTEM_PROMPT,
+    DEVELOPER_IMPLEMENT_HEADER,
+    DEVELOPER_IMPLEMENT_TAIL,
     DEVELOPER_IMPLEMENT_PROMPT,
+    DEVELOPER_REVISE_HEADER,
+    DEVELOPER_REVISE_TAIL,
     DEVELOPER_REVISE_PROMPT,
+    DEVELOPER_REVISE_DIFF_HEADER,
+    DEVELOPER_REVISE_DIFF_TAIL,
+    DEVELOPER_REVISE_DIFF_PROMPT,
     DEVELOPER_PLAN_PROMPT,
+    render_implement_header,
+    render_implement_tail,
+    render_revise_header,
+    render_revise_tail,
+    render_revise_diff_header,
+    render_revise_diff_tail,
+    render_plan,
 )
+from .template import compile_template
 
 __all__ = [
     "MANAGER_SYSTEM_PROMPT",
+    "MANAGER_REVIEW_HEADER",
+    "MANAGER_REVIEW_TAIL",
     "MANAGER_REVIEW_PROMPT",
+    "MANAGER_PLANNING_HEADER",
+    "MANAGER_PLANNING_TAIL",
     "MANAGER_PLANNING_PROMPT",
+    "MANAGER_CRITIC_PROMPTS",
     "DEVELOPER_SYSTEM_PROMPT",
+    "DEVELOPER_DOC_SYSTEM_PROMPT",
+    "DEVELOPER_IMPLEMENT_HEADER",
+    "DEVELOPER_IMPLEMENT_TAIL",
     "DEVELOPER_IMPLEMENT_PROMPT",
+    "DEVELOPER_REVISE_HEADER",
+    "DEVELOPER_REVISE_TAIL",
     "DEVELOPER_REVISE_PROMPT",
+    "DEVELOPER_REVISE_DIFF_HEADER",
+    "DEVELOPER_REVISE_DIFF_TAIL",
+    "DEVELOPER_REVISE_DIFF_PROMPT",
     "DEVELOPER_PLAN_PROMPT",
+    "render_review_header",
+    "render_review_tail",
+    "render_planning_header",
+    "render_planning_tail",
+    "render_implement_header",
+    "render_implement_tail",
+    "render_revise_header",
+    "render_revise_tail",
+    "render_revise_diff_header",
+    "render_revise_diff_tail",
+    "render_plan",
+    "compile_template",
 ]
@@ -1,5 +1,7 @@
 """Developer role prompts - Implementation focused"""
 
+from .template import compile_template
+
 DEVELOPER_SYSTEM_PROMPT = """당신은 숙련된 소프트웨어 개발자입니다.
 
 ## 핵심 역할
@@ -27,33 +29,60 @@ DEVELOPER_SYSTEM_PROMPT = """당신은 숙련된 소프트웨어 개발자입니
 4. 예상 리스크 및 대응 방안
 """
 
-DEVELOPER_IMPLEMENT_PROMPT = """다음 요구사항을 구현해주세요:
+DEVELOPER_DOC_SYSTEM_PROMPT = DEVELOPER_SYSTEM_PROMPT + "\n\n문서 작성 시 명확하고 구조화된 형식을 사용하세요."
+
+# Implementation/revision prompts are split into a static header (instructions + requirements,
+# identical across iterations so providers can cache the prefix) and a dynamic tail.
+DEVELOPER_IMPLEMENT_HEADER = """다음 요구사항을 구현해주세요.
+요구사항에 맞는 코드를 작성해주세요.
 
 ## 요구사항
 {requirements}
+"""
 
+DEVELOPER_IMPLEMENT_TAIL = """
 ## PM 추가 지시사항
 {instructions}
-
----
-위 요구사항에 맞는 코드를 작성해주세요.
 """
 
-DEVELOPER_REVISE_PROMPT = """PM으로부터 다음 피드백을 받았습니다. 수정해주세요:
+DEVELOPER_IMPLEMENT_PROMPT = DEVELOPER_IMPLEMENT_HEADER + DEVELOPER_IMPLEMENT_TAIL
+
+DEVELOPER_REVISE_HEADER = """PM으로부터 피드백을 받았습니다. 수정해주세요.
+피드백을 반영하여 개선된 버전을 제출해주세요.
 
 ## 원본 요구사항
 {requirements}
+"""
 
+DEVELOPER_REVISE_TAIL = """
 ## 이전 제출물
 {previous_submission}
 
 ## PM 피드백
 {feedback}
+"""
 
----
-피드백을 반영하여 개선된 버전을 제출해주세요.
+DEVELOPER_REVISE_PROMPT = DEVELOPER_REVISE_HEADER + DEVELOPER_REVISE_TAIL
+
+# Diff-based revision: a base submission joins the cached header, and each iteration
+# sends only the previous submission's changes against it.
+DEVELOPER_REVISE_DIFF_HEADER = DEVELOPER_REVISE_HEADER + """
+## 기준 제출물
+{base_submission}
+"""
+
+DEVELOPER_REVISE_DIFF_TAIL = """
+## 이전 제출물 (기준 제출물 대비 unified diff)
+{diff}
+
+## PM 피드백
+{feedback}
+
+diff를 기준 제출물에 적용한 것이 이전 제출물입니다. diff가 아닌 전체 수정본을 제출해주세요.
 """
 
+DEVELOPER_REVISE_DIFF_PROMPT = DEVELOPER_REVISE_DIFF_HEADER + DEVELOPER_REVISE_DIFF_TAIL
+
 DEVELOPER_PLAN_PROMPT = """다음 프로젝트에 대한 구현 계획을 작성해주세요:
 
 ## 요구사항
@@ -62,3 +91,12 @@ DEVELOPER_PLAN_PROMPT = """다음 프로젝트에 대한 구현 계획을 작성
 ---
 단계별 구현 계획, 기술 스택, 예상 이슈 등을 포함해주세요.
 """
+
+# Templates parsed once at import; used by the workflow loops instead of .format()
+render_implement_header = compile_template(DEVELOPER_IMPLEMENT_HEADER)
+render_implement_tail = compile_template(DEVELOPER_IMPLEMENT_TAIL)
+render_revise_header = compile_template(DEVELOPER_REVISE_HEADER)
+render_revise_tail = compile_template(DEVELOPER_REVISE_TAIL)
+render_revise_diff_header = compile_template(DEVELOPER_REVISE_DIFF_HEADER)
+render_revise_diff_tail = compile_template(DEVELOPER_REVISE_DIFF_TAIL)
+render_plan = compile_template(DEVELOPER_PLAN_PROMPT)
@@ -1,5 +1,7 @@
 """Manager (PM) role prompts - Strict reviewer"""
 
+from .template import compile_template
+
 MANAGER_SYSTEM_PROMPT = """당신은 매우 까다롭고 꼼꼼한 프로젝트 매니저(PM)입니다.
 
 ## 핵심 역할
@@ -28,27 +30,60 @@ MANAGER_SYSTEM_PROMPT = """당신은 매우 까다롭고 꼼꼼한 프로젝트
 3. 수정 요청 사항 또는 [APPROVED]
 """
 
-MANAGER_REVIEW_PROMPT = """다음 {task_type}을(를) 검토해주세요:
+# Review/planning prompts are split into a static header (instructions + requirements,
+# identical across iterations so providers can cache the prefix) and a dynamic tail.
+MANAGER_REVIEW_HEADER = """다음 {task_type}을(를) 검토해주세요.
+아래 제출물을 엄격하게 검토하고 피드백을 제공해주세요.
+충분히 만족스러우면 [APPROVED] 태그를 포함해주세요.
 
 ## 원본 요구사항
 {requirements}
+"""
 
+MANAGER_REVIEW_TAIL = """
 ## 개발자 제출물
 {submission}
-
----
-위 제출물을 엄격하게 검토하고 피드백을 제공해주세요.
-충분히 만족스러우면 [APPROVED] 태그를 포함해주세요.
 """
 
-MANAGER_PLANNING_PROMPT = """다음 프로젝트 요구사항에 대한 개발자의 계획을 검토해주세요:
+MANAGER_REVIEW_PROMPT = MANAGER_REVIEW_HEADER + MANAGER_REVIEW_TAIL
+
+MANAGER_PLANNING_HEADER = """다음 프로젝트 요구사항에 대한 개발자의 계획을 검토해주세요.
+계획의 완성도, 실현 가능성, 누락된 부분을 검토해주세요.
 
 ## 요구사항
 {requirements}
+"""
 
+MANAGER_PLANNING_TAIL = """
 ## 개발자 계획
 {plan}
+"""
+
+MANAGER_PLANNING_PROMPT = MANAGER_PLANNING_HEADER + MANAGER_PLANNING_TAIL
 
+# Templates parsed once at import; used by the workflow loops instead of .format()
+render_review_header = compile_template(MANAGER_REVIEW_HEADER)
+render_review_tail = compile_template(MANAGER_REVIEW_TAIL)
+render_planning_header = compile_template(MANAGER_PLANNING_HEADER)
+render_planning_tail = compile_template(MANAGER_PLANNING_TAIL)
+
+# Focus instructions for independent critics that review the same submission in parallel.
+# Appended after the shared review prompt so every critic reuses the cached prefix.
+MANAGER_CRITIC_PROMPTS = {
+    "correctness": """
 ---
-계획의 완성도, 실현 가능성, 누락된 부분을 검토해주세요.
-"""
+이번 검토에서는 **정확성**에만 집중하세요: 요구사항 충족 여부, 로직 오류, 엣지 케이스, 에러 핸들링.
+""",
+    "style": """
+---
+이번 검토에서는 **코드 품질**에만 집중하세요: 가독성, 네이밍, 구조, 유지보수성.
+""",
+    "security": """
+---
+이번 검토에서는 **보안**에만 집중하세요: 입력 검증, 인젝션, 민감 정보 노출, 안전하지 않은 기본값.
+""",
+    "tests": """
+---
+이번 검토에서는 **테스트**에만 집중하세요: 테스트 가능성, 누락된 테스트 케이스, 검증 방법의 충분성.
+""",
+}
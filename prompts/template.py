@@ -0,0 +1,29 @@
+"""Pre-compiled prompt templates"""
+
+from string import Formatter
+from typing import Callable
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """Split a str.format template once so rendering is plain string concatenation.
+
+    The returned function takes the same keyword arguments as ``template.format``.
+    Format specs and conversions are not supported (the prompts don't use them).
+    """
+    literals, fields = [], []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in template field: {field}")
+        literals.append(literal)
+        fields.append(field)
+
+    def render(**values) -> str:
+        parts = []
+        for literal, field in zip(literals, fields):
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+    render.template = template
+    return render
@@ -0,0 +1,252 @@
+"""Exact-match and semantic response caches for AI client calls"""
+
+import hashlib
+import importlib.util
+import json
+import math
+import operator
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from dataclasses import asdict, replace
+
+from ai_clients import AIClient, Message, Usage
+
+
+class ResponseCache:
+    """In-memory dict in front of a SQLite table, keyed by a hash of the full request"""
+
+    def __init__(self, path: str, ttl: int = 86400):
+        self.path = path
+        self.ttl = ttl
+        self._memory: dict[str, tuple[str, Usage]] = {}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and drop expired rows"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, usage TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(client: AIClient, messages: list[Message], system_prompt: str) -> str:
+        """Hash provider, model, temperature, system prompt and message contents"""
+        h = hashlib.blake2b(digest_size=32)
+        parts = (
+            getattr(client, "provider", type(client).__name__),
+            getattr(client, "model", ""),
+            str(getattr(client, "temperature", "")),
+            system_prompt,
+        )
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        for msg in messages:
+            h.update(msg.role.encode("utf-8"))
+            h.update(b"\x00")
+            h.update(msg.content.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[str, Usage] | None:
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+            row = self._connect().execute(
+                "SELECT text, usage FROM responses WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+
+            result = (row[0], Usage(**json.loads(row[1])))
+            self._memory[key] = result
+            return result
+
+    def set(self, key: str, text: str, usage: Usage):
+        # A cached answer arrives instantly, so don't replay the original latency
+        usage = replace(usage, first_token_latency=0.0)
+        with self._lock:
+            self._memory[key] = (text, usage)
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, text, usage, created_at) VALUES (?, ?, ?, ?)",
+                (key, text, json.dumps(asdict(usage)), time.time()),
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Optional embedding/ANN backends; the hashed bag-of-words fallback needs neither
+_HAS_SENTENCE_TRANSFORMERS = importlib.util.find_spec("sentence_transformers") is not None
+_HAS_FAISS = importlib.util.find_spec("faiss") is not None and importlib.util.find_spec("numpy") is not None
+
+SENTENCE_MODEL = "all-MiniLM-L6-v2"
+HASHED_DIM = 1024
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class _ScopeIndex:
+    """Normalized embeddings of one (provider, model, temperature, system prompt) scope"""
+
+    def __init__(self, dim: int):
+        self.entries: list[tuple[str, Usage]] = []
+        self.vectors: list[array] = []
+        self.faiss_index = None
+        if _HAS_FAISS:
+            import faiss
+
+            self.faiss_index = faiss.IndexFlatIP(dim)
+
+    def add(self, vector: array, text: str, usage: Usage):
+        self.entries.append((text, usage))
+        if self.faiss_index is not None:
+            import numpy as np
+
+            self.faiss_index.add(np.frombuffer(vector, dtype=np.float32).reshape(1, -1))
+        else:
+            self.vectors.append(vector)
+
+    def search(self, vector: array) -> tuple[float, int]:
+        """Best cosine score and entry index (vectors are unit length, so dot product)"""
+        if not self.entries:
+            return 0.0, -1
+        if self.faiss_index is not None:
+            import numpy as np
+
+            scores, ids = self.faiss_index.search(np.frombuffer(vector, dtype=np.float32).reshape(1, -1), 1)
+            return float(scores[0][0]), int(ids[0][0])
+        scores = [sum(map(operator.mul, vector, other)) for other in self.vectors]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return scores[best], best
+
+
+class SemanticCache:
+    """Near-duplicate response cache: cosine match on prompt embeddings within a scope.
+
+    Uses sentence-transformers embeddings when installed (and faiss for the search),
+    otherwise a hashed bag-of-words vector with a linear scan.
+    """
+
+    def __init__(self, path: str, ttl: int = 86400, threshold: float = 0.97):
+        self.path = path
+        self.ttl = ttl
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._conn = None
+        self._model = None
+        self._scopes: dict[str, _ScopeIndex] = {}
+        if _HAS_SENTENCE_TRANSFORMERS:
+            self.embedder, self.dim = f"st:{SENTENCE_MODEL}", 384
+        else:
+            self.embedder, self.dim = f"hashed:{HASHED_DIM}", HASHED_DIM
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and drop expired rows"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic ("
+                "scope TEXT NOT NULL, embedding BLOB NOT NULL, text TEXT NOT NULL, "
+                "usage TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS semantic_scope ON semantic (scope)")
+            self._conn.execute("DELETE FROM semantic WHERE created_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+        return self._conn
+
+    def _scope_key(self, client: AIClient, system_prompt: str) -> str:
+        """Only responses from the same client settings, system prompt and embedder are comparable"""
+        h = hashlib.blake2b(digest_size=16)
+        parts = (
+            getattr(client, "provider", type(client).__name__),
+            getattr(client, "model", ""),
+            str(getattr(client, "temperature", "")),
+            system_prompt,
+            self.embedder,
+        )
+        for part in parts:
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def _embed(self, text: str) -> array:
+        """Unit-length float32 embedding of the prompt text"""
+        if _HAS_SENTENCE_TRANSFORMERS:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(SENTENCE_MODEL)
+            return array("f", self._model.encode(text, normalize_embeddings=True).tolist())
+
+        # Signed feature hashing; crc32 is stable across processes, unlike hash()
+        vector = array("f", bytes(4 * HASHED_DIM))
+        for word in _WORD_RE.findall(text.lower()):
+            h = zlib.crc32(word.encode("utf-8"))
+            vector[h % HASHED_DIM] += 1.0 if h & 0x80000000 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return array("f", [v / norm for v in vector])
+
+    def _scope(self, scope: str) -> _ScopeIndex:
+        """Load a scope's live entries from SQLite the first time it is searched"""
+        index = self._scopes.get(scope)
+        if index is None:
+            index = _ScopeIndex(self.dim)
+            rows = self._connect().execute(
+                "SELECT embedding, text, usage FROM semantic WHERE scope = ? AND created_at >= ?",
+                (scope, time.time() - self.ttl),
+            )
+            for blob, text, usage in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                index.add(vector, text, Usage(**json.loads(usage)))
+            self._scopes[scope] = index
+        return index
+
+    def get(self, client: AIClient, messages: list[Message], system_prompt: str) -> tuple[str, Usage] | None:
+        vector = self._embed("\n".join(msg.content for msg in messages))
+        with self._lock:
+            index = self._scope(self._scope_key(client, system_prompt))
+            score, best = index.search(vector)
+            if score < self.threshold:
+                return None
+            return index.entries[best]
+
+    def set(self, client: AIClient, messages: list[Message], system_prompt: str, text: str, usage: Usage):
+        vector = self._embed("\n".join(msg.content for msg in messages))
+        usage = replace(usage, first_token_latency=0.0)
+        scope = self._scope_key(client, system_prompt)
+        with self._lock:
+            self._scope(scope).add(vector, text, usage)
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO semantic (scope, embedding, text, usage, created_at) VALUES (?, ?, ?, ?, ?)",
+                (scope, vector.tobytes(), text, json.dumps(asdict(usage)), time.time()),
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
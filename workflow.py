@@ -1,30 +1,65 @@
 """Collaboration workflow engine - Agile-style AI collaboration"""
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import os
-from datetime import datetime
-from dataclasses import dataclass, field
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from collections import Counter, deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Callable
-from difflib import SequenceMatcher
+from difflib import SequenceMatcher, unified_diff
 
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.prompt import Confirm
+from rich.text import Text
 
-from ai_clients import AIClient, Message, create_client
+try:
+    # Optional native similarity (pip install difflib-fast): same ratio in linear time
+    from difflib_fast import ratio as _fast_ratio
+except ImportError:
+    _fast_ratio = None
+
+from ai_clients import AIClient, Message, Usage, cacheable_user, create_client
+from response_cache import ResponseCache, SemanticCache
 from prompts import (
     MANAGER_SYSTEM_PROMPT,
-    MANAGER_REVIEW_PROMPT,
-    MANAGER_PLANNING_PROMPT,
+    MANAGER_CRITIC_PROMPTS,
     DEVELOPER_SYSTEM_PROMPT,
-    DEVELOPER_IMPLEMENT_PROMPT,
-    DEVELOPER_REVISE_PROMPT,
-    DEVELOPER_PLAN_PROMPT,
+    DEVELOPER_DOC_SYSTEM_PROMPT,
+    render_review_header,
+    render_review_tail,
+    render_planning_header,
+    render_planning_tail,
+    render_implement_header,
+    render_implement_tail,
+    render_revise_header,
+    render_revise_tail,
+    render_revise_diff_header,
+    render_revise_diff_tail,
+    render_plan,
 )
 
 
+# Manager reviews stream and stop as soon as this tag appears (see AIClient.chat)
+APPROVAL_MARKER = "[APPROVED]"
+# Searching with IGNORECASE avoids copying the whole response through .upper()
+_APPROVED_RE = re.compile(re.escape(APPROVAL_MARKER), re.IGNORECASE)
+
+# Longer messages are shown as plain text even with verbose_markdown; Markdown
+# parsing of huge, mostly-code responses is pathological
+MARKDOWN_MAX_CHARS = 50_000
+
+
 class WorkflowPhase(Enum):
     PLANNING = "planning"
     IMPLEMENTATION = "implementation"
@@ -44,7 +79,8 @@ class ConversationTurn:
     role: str  # "manager" or "developer"
     content: str
     phase: WorkflowPhase
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # time.monotonic_ns(); CollaborationWorkflow.turn_time() converts it to wall-clock time
+    timestamp: int = field(default_factory=time.monotonic_ns)
 
 
 @dataclass
@@ -75,15 +111,42 @@ class CollaborationWorkflow:
         checkpoint_interval: int = None,
         max_no_progress: int = 3,
         early_stop_similarity: float = 0.95,
+        similarity_window: int = 2048,
+        revise_diff_ratio: float = 0.5,
         budget_mode: str = "balanced",
+        response_cache: bool = False,
+        cache_ttl: int = 86400,
+        semantic_cache: bool = False,
+        semantic_threshold: float = 0.97,
+        verbose_markdown: bool = False,
+        live_output: bool = True,
+        max_concurrent_reviews: int = 3,
+        max_history_turns: int = None,
     ):
         self.manager = manager_client
         self.developer = developer_client
+        # Provider and model are fixed per client, so look up their rates once
+        self._manager_rates = self._cost_rates(manager_client)
+        self._developer_rates = self._cost_rates(developer_client)
         self.console = Console()
         self.on_message = on_message
-        self.conversation_history: list[ConversationTurn] = []
+        self.verbose_markdown = verbose_markdown
+        # Stream responses into a live panel while they arrive (terminals only)
+        self.live_output = live_output
+        self.conversation_history: deque[ConversationTurn] = deque()
         self.output_dir = output_dir
 
+        # Turns are appended to output_dir/run_<ts>.jsonl as they happen; only the
+        # last max_history_turns (None = all) are kept in memory
+        self.max_history_turns = max_history_turns
+        self._log = None
+        self._log_path = None
+        self._logged_turns = 0
+        # Wall-clock anchor for monotonic turn timestamps; the log stores offsets from it
+        self._start_wall = datetime.now()
+        self._start_mono = time.monotonic_ns()
+        self._run_started = self._start_wall.isoformat()
+
         # Budget mode presets
         self.budget_mode = budget_mode
         self._apply_budget_mode(budget_mode, max_iterations, max_tokens, max_cost, checkpoint_interval)
@@ -91,12 +154,52 @@ class CollaborationWorkflow:
         # Advanced controls
         self.max_no_progress = max_no_progress
         self.early_stop_similarity = early_stop_similarity
+        # Progress checks compare only the first/last N characters (0 = whole text)
+        self.similarity_window = similarity_window
+        # Revisions send a diff against the last full submission while the diff is
+        # under this fraction of the submission (0 = always send it in full)
+        self.revise_diff_ratio = revise_diff_ratio
+        self._last_sent_submission: str | None = None
+        self._last_sent_header: str | None = None
+        self.max_concurrent_reviews = max_concurrent_reviews
+        self.critic_latencies: list[tuple[str, float]] = []  # (aspect, seconds) per critic call
+
+        # Identical requests (retries, re-runs) are answered from a local cache
+        self._msg_cache = (
+            ResponseCache(os.path.join(output_dir, ".msg_cache.sqlite"), ttl=cache_ttl)
+            if response_cache else None
+        )
+        # Near-duplicate prompts (same scope, cosine >= semantic_threshold) reuse a prior answer
+        self._semantic_cache = (
+            SemanticCache(
+                os.path.join(output_dir, ".semantic_cache.sqlite"), ttl=cache_ttl, threshold=semantic_threshold
+            )
+            if semantic_cache else None
+        )
 
         # Tracking variables
         self.total_tokens = 0
         self.total_cost = 0.0
+        self.cached_tokens = 0
+        # Responses replayed from the response caches; they cost nothing and are not counted as spend
+        self.replayed_responses = 0
+        self.replayed_tokens = 0
+        self.first_token_latencies: list[float] = []
         self.no_progress_count = 0
         self.previous_submission_text = None
+        # Character counts of previous_submission_text, reused by the next quick_ratio bound
+        self._previous_counts: Counter | None = None
+        # Fallback matcher; its seq2 index (b2j) is carried over to the next comparison
+        self._matcher = SequenceMatcher(None, autojunk=False)
+
+        # Result file I/O runs off the main thread
+        self._io_executor: ThreadPoolExecutor | None = None
+        self._console_executor: ThreadPoolExecutor | None = None
+        # Runs the next API call while a user checkpoint waits for an answer
+        self._speculative_executor: ThreadPoolExecutor | None = None
+        self._pending_output: list[Future] = []
+        self._pending_saves: list[Future] = []
+        self._output_dir_created = False
 
     def _apply_budget_mode(self, mode: str, max_iter, max_tok, max_c, checkpoint):
         """Apply budget mode presets"""
@@ -127,62 +230,367 @@ class CollaborationWorkflow:
         self.max_iterations = max_iter if max_iter != 10 else preset["max_iterations"]
         self.max_tokens = max_tok if max_tok is not None else preset["max_tokens"]
         self.max_cost = max_c if max_c is not None else preset["max_cost"]
-        self.checkpoint_interval = checkpoint if checkpoint is not None else preset["checkpoint_interval"]
+        checkpoint = checkpoint if checkpoint is not None else preset["checkpoint_interval"]
+        # 0/None disables the prompt; anything else is at least every iteration
+        self.checkpoint_interval = max(1, checkpoint) if checkpoint else None
 
     def _display_message(self, role: str, content: str, phase: str):
         """Display a message in the console"""
+        self._submit_output(self._print_panel, role, content, phase)
+
+        if self.on_message:
+            self.on_message(role, content, phase)
+
+    def _print_panel(self, role: str, content: str, phase: str):
+        """Build and print a message panel (runs on the console worker)"""
+        # Markdown parsing dominates rendering on long responses; plain text skips it.
+        # Streamed turns were shown live as plain text, so this is the only parse
+        if self.verbose_markdown and len(content) < MARKDOWN_MAX_CHARS:
+            body = Markdown(content)
+        else:
+            body = Text(content, overflow="fold")
+        self.console.print(self._panel(role, body, phase))
+
+    @staticmethod
+    def _panel(role: str, body, subtitle: str) -> Panel:
         colors = {"manager": "red", "developer": "green", "system": "blue"}
         titles = {"manager": "PM (Manager)", "developer": "Developer", "system": "System"}
+        return Panel(
+            body,
+            title=f"[bold {colors.get(role, 'white')}]{titles.get(role, role)}[/]",
+            subtitle=f"[dim]{subtitle}[/]",
+            border_style=colors.get(role, "white"),
+            highlight=False,
+        )
 
-        self.console.print(
-            Panel(
-                Markdown(content),
-                title=f"[bold {colors.get(role, 'white')}]{titles.get(role, role)}[/]",
-                subtitle=f"[dim]{phase}[/]",
-                border_style=colors.get(role, "white"),
-            )
+    def _submit_output(self, fn: Callable, *args):
+        """Queue console output on a single worker so rendering overlaps the next API call.
+
+        One worker keeps output in submission order; call _flush_console() before
+        reading input or handing the console back to the caller.
+        """
+        if self._console_executor is None:
+            self._console_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="console")
+        self._pending_output.append(self._console_executor.submit(fn, *args))
+
+    def _print(self, *objects):
+        self._submit_output(self.console.print, *objects)
+
+    def _flush_console(self):
+        """Wait for queued console output, re-raising any rendering error"""
+        pending, self._pending_output = self._pending_output, []
+        for future in pending:
+            future.result()
+
+    def _cached_response(
+        self, client: AIClient, messages: list[Message], system_prompt: str, semantic: bool = False
+    ) -> tuple[str, Usage] | None:
+        """Look up an exact match first, then (for semantic calls) a near-duplicate prompt.
+
+        Only a run's entry calls are semantic: inside the loops a one-line fix to the
+        submission is a near-duplicate prompt that needs a different answer.
+        """
+        cached = None
+        if self._msg_cache is not None:
+            cached = self._msg_cache.get(self._msg_cache.make_key(client, messages, system_prompt))
+        if cached is None and semantic and self._semantic_cache is not None:
+            cached = self._semantic_cache.get(client, messages, system_prompt)
+        if cached is None:
+            return None
+
+        text, usage = cached
+        tokens = usage.prompt_tokens + usage.completion_tokens
+        self.replayed_responses += 1
+        self.replayed_tokens += tokens
+        self._print(f"[dim]↺ Cache hit: replaying a stored response ({tokens:,} tokens, not billed)[/dim]")
+        # Nothing was spent, so the usage reported back to the budget is empty
+        return text, Usage()
+
+    def _store_response(
+        self,
+        client: AIClient,
+        messages: list[Message],
+        system_prompt: str,
+        text: str,
+        usage: Usage,
+        semantic: bool = False,
+    ):
+        if self._msg_cache is not None:
+            self._msg_cache.set(self._msg_cache.make_key(client, messages, system_prompt), text, usage)
+        if semantic and self._semantic_cache is not None:
+            self._semantic_cache.set(client, messages, system_prompt, text, usage)
+
+    def _chat(
+        self,
+        client: AIClient,
+        messages: list[Message],
+        system_prompt: str,
+        stop_marker: str = None,
+        semantic: bool = False,
+    ) -> tuple[str, Usage]:
+        """Call a client, answering repeated requests from the response caches"""
+        cached = self._cached_response(client, messages, system_prompt, semantic)
+        if cached is not None:
+            return cached
+
+        if self.live_output and self.console.is_terminal:
+            text, usage = self._chat_live(client, messages, system_prompt, stop_marker)
+        else:
+            text, usage = client.chat(messages, system_prompt=system_prompt, stop_marker=stop_marker)
+        self._store_response(client, messages, system_prompt, text, usage, semantic)
+        return text, usage
+
+    def _chat_live(
+        self, client: AIClient, messages: list[Message], system_prompt: str, stop_marker: str = None
+    ) -> tuple[str, Usage]:
+        """Stream a response into a transient live panel; the finished turn is printed as usual"""
+        role = "manager" if client is self.manager else "developer"
+        parts, usage, body = [], Usage(), Text(overflow="fold")
+        # Live draws on the console directly, so queued output must be written first
+        self._flush_console()
+        with Live(self._panel(role, body, "streaming..."), console=self.console, refresh_per_second=8, transient=True):
+            for delta in client.stream_chat(messages, system_prompt, stop_marker, usage):
+                parts.append(delta)
+                body.append(delta)
+        return "".join(parts), usage
+
+    async def _chat_async(
+        self,
+        client: AIClient,
+        messages: list[Message],
+        system_prompt: str,
+        stop_marker: str = None,
+        semantic: bool = False,
+        usage: Usage = None,
+    ) -> tuple[str, Usage]:
+        """Async variant of _chat; usage (if given) is filled in place as the call proceeds"""
+        cached = self._cached_response(client, messages, system_prompt, semantic)
+        if cached is not None:
+            return cached
+
+        text, usage = await client.chat_async(
+            messages, system_prompt=system_prompt, stop_marker=stop_marker, usage=usage
         )
+        self._store_response(client, messages, system_prompt, text, usage, semantic)
+        return text, usage
 
-        if self.on_message:
-            self.on_message(role, content, phase)
+    def _reset_run_state(self):
+        """Start a fresh run log and clear per-run totals and progress tracking"""
+        self._start_run_log()
+        self.total_tokens = 0
+        self.total_cost = 0.0
+        self.cached_tokens = 0
+        self.replayed_responses = 0
+        self.replayed_tokens = 0
+        self.first_token_latencies = []
+        self.critic_latencies = []
+        self.no_progress_count = 0
+        self.previous_submission_text = None
+        self._previous_counts = None
+        self._matcher = SequenceMatcher(None, autojunk=False)
+        self._last_sent_submission = None
+        self._last_sent_header = None
+
+    def _start_run_log(self):
+        """Reset the in-memory history and open a fresh JSONL log for this run"""
+        if self._log:
+            # A previous run that raised keeps its .tmp name, marking it as interrupted
+            self._log.close()
+        self.conversation_history = deque(maxlen=self.max_history_turns)
+
+        if not self._output_dir_created:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._output_dir_created = True
+        # Microseconds keep back-to-back runs from sharing a log file. The log is
+        # written as .jsonl.tmp and renamed once the run finishes, so a leftover
+        # .tmp marks an interrupted run (see resume_from)
+        self._start_wall = datetime.now()
+        self._start_mono = time.monotonic_ns()
+        self._run_started = self._start_wall.isoformat()
+        timestamp = self._start_wall.strftime("%Y%m%d_%H%M%S_%f")
+        self._log_path = os.path.join(self.output_dir, f"run_{timestamp}.jsonl.tmp")
+        self._log = open(self._log_path, "w", encoding="utf-8")
+        self._logged_turns = 0
+
+    def _close_run_log(self):
+        if self._log:
+            self._log.close()
+            self._log = None
+            final_path = self._log_path.removesuffix(".tmp")
+            os.replace(self._log_path, final_path)
+            self._log_path = final_path
+
+    def resume_from(self, jsonl_path: str) -> dict:
+        """Rehydrate history, totals and progress state from a run log.
+
+        Turns after the last manager review are dropped, since that iteration
+        never completed. Returns iterations/previous_submission/manager_feedback
+        for run_development to continue from.
+        """
+        records = self._read_run_log(jsonl_path)
+        last_review = max((i for i, r in enumerate(records) if r["role"] == "manager"), default=-1)
+        records = records[: last_review + 1]
+        if not records:
+            raise ValueError(f"No reviewed turns to resume from in {jsonl_path}")
+
+        developer_turns = [r for r in records if r["role"] == "developer"]
+        self.total_tokens = records[-1].get("total_tokens", 0)
+        self.total_cost = records[-1].get("total_cost", 0.0)
+        self.previous_submission_text = developer_turns[-1]["content"] if developer_turns else None
+        self.no_progress_count = 0
+        for record in records:
+            self._record_turn(self._turn_from_record(record))
+
+        return {
+            "iterations": sum(1 for r in developer_turns if r["phase"] == WorkflowPhase.IMPLEMENTATION.value),
+            "previous_submission": developer_turns[-1]["content"] if developer_turns else "",
+            "manager_feedback": records[-1]["content"],
+        }
+
+    @staticmethod
+    def _read_run_log(jsonl_path: str) -> list[dict]:
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _turn_from_record(self, record: dict) -> ConversationTurn:
+        return ConversationTurn(
+            role=record["role"],
+            content=record["content"],
+            phase=WorkflowPhase(record["phase"]),
+            timestamp=self._parse_timestamp(record),
+        )
+
+    def _checkpoint_path(self, requirements: str) -> str:
+        digest = hashlib.sha256(requirements.encode("utf-8")).hexdigest()
+        return os.path.join(self.output_dir, ".ckpt", f"{digest}.json")
+
+    def _save_checkpoint(
+        self, path: str, iterations: int, previous_submission: str, manager_feedback: str, phase: WorkflowPhase
+    ):
+        """Snapshot loop state so an interrupted run can resume after the last completed iteration"""
+        state = {
+            "iterations": iterations,
+            "previous_submission": previous_submission,
+            "manager_feedback": manager_feedback,
+            "phase": phase.value,
+            "total_tokens": self.total_tokens,
+            "total_cost": self.total_cost,
+            "no_progress_count": self.no_progress_count,
+            "previous_submission_text": self.previous_submission_text,
+            # conversation_history may keep only the last max_history_turns, so the
+            # checkpoint points at the run log instead and replays it on resume
+            "log_path": self._log_path,
+            "logged_turns": self._logged_turns,
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _load_checkpoint(self, path: str) -> dict | None:
+        """Load a checkpoint and restore tracking state and history from it"""
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        self.total_tokens = state["total_tokens"]
+        self.total_cost = state["total_cost"]
+        self.no_progress_count = state["no_progress_count"]
+        self.previous_submission_text = state["previous_submission_text"]
+        log_path = state["log_path"]
+        if not os.path.exists(log_path):
+            # The checkpointed run ended without approval, so its log was renamed
+            log_path = log_path.removesuffix(".tmp")
+        for record in self._read_run_log(log_path)[: state["logged_turns"]]:
+            self._record_turn(self._turn_from_record(record))
+        return state
+
+    def turn_time(self, turn: ConversationTurn) -> datetime:
+        """Wall-clock time of a turn from the current (or last) run"""
+        return self._start_wall + timedelta(microseconds=(turn.timestamp - self._start_mono) // 1000)
+
+    def _parse_timestamp(self, record: dict) -> int:
+        """Map a logged turn time back onto this process's monotonic clock"""
+        if "elapsed_ns" in record:
+            started = datetime.fromisoformat(record["run_started"])
+            wall = started + timedelta(microseconds=record["elapsed_ns"] // 1000)
+        else:
+            wall = datetime.fromisoformat(record["timestamp"])  # Logs written before elapsed_ns
+        return self._start_mono + (wall - self._start_wall) // timedelta(microseconds=1) * 1000
+
+    def _turn_record(self, turn: ConversationTurn) -> dict:
+        # Integer offset from the run's start; no date formatting per turn
+        return {
+            "role": turn.role,
+            "content": turn.content,
+            "phase": turn.phase.value,
+            "elapsed_ns": turn.timestamp - self._start_mono,
+            "run_started": self._run_started,
+        }
+
+    def _record_turn(self, turn: ConversationTurn):
+        """Keep a turn in memory and append it to the run log"""
+        self.conversation_history.append(turn)
+        if self._log:
+            # Running totals ride along so a log alone is enough to resume from
+            record = {
+                **self._turn_record(turn),
+                "total_tokens": self.total_tokens,
+                "total_cost": self.total_cost,
+            }
+            self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log.flush()
+            self._logged_turns += 1
 
     def _add_turn(self, role: str, content: str, phase: WorkflowPhase):
         """Add a conversation turn"""
         turn = ConversationTurn(role=role, content=content, phase=phase)
-        self.conversation_history.append(turn)
+        self._record_turn(turn)
         self._display_message(role, content, phase.value)
 
     def _check_approval(self, response: str) -> bool:
         """Check if the manager approved"""
-        return "[APPROVED]" in response.upper()
-
-    def _estimate_tokens(self, text: str) -> int:
-        """Rough estimate of tokens (1 token ≈ 4 characters)"""
-        return len(text) // 4
+        return _APPROVED_RE.search(response) is not None
 
-    def _estimate_cost(self, tokens: int, provider: str, model: str) -> float:
-        """Estimate API cost based on tokens"""
-        # Rough estimates (per 1M tokens)
+    @staticmethod
+    def _cost_rates(client: AIClient) -> tuple[float, float]:
+        """(input rate, cached input rate) per token for a client's provider and model"""
+        # Rough estimates (per 1M tokens): (input rate, cached input rate)
         cost_map = {
-            "openai": {"gpt-4o": 2.5, "gpt-5.1-codex-mini": 1.0, "o1-mini": 3.0},
+            "openai": {"gpt-4o": (2.5, 1.25), "gpt-5.1-codex-mini": (1.0, 0.1), "o1-mini": (3.0, 1.5)},
             "anthropic": {
-                "claude-sonnet-4-20250514": 3.0,
-                "claude-opus-4-20250514": 15.0,
+                "claude-sonnet-4-20250514": (3.0, 0.3),
+                "claude-opus-4-20250514": (15.0, 1.5),
             },
         }
 
-        rate = cost_map.get(provider, {}).get(model, 2.0)
-        return (tokens / 1_000_000) * rate
-
-    def _track_usage(self, text: str, client: AIClient):
-        """Track token usage and cost"""
-        tokens = self._estimate_tokens(text)
-        self.total_tokens += tokens
-
         provider = getattr(client, "provider", "unknown")
         model = getattr(client, "model", "unknown")
-        cost = self._estimate_cost(tokens, provider, model)
-        self.total_cost += cost
+        rate, cached_rate = cost_map.get(provider, {}).get(model, (2.0, 0.2))
+        return rate * 1e-6, cached_rate * 1e-6
+
+    @staticmethod
+    def _estimate_cost(tokens: int, rates: tuple[float, float], cached_tokens: int = 0) -> float:
+        """Estimate API cost based on tokens, billing cache reads at the cached rate"""
+        rate, cached_rate = rates
+        cached_tokens = min(cached_tokens, tokens)
+        return (tokens - cached_tokens) * rate + cached_tokens * cached_rate
+
+    def _track_usage(self, client: AIClient, usage: Usage):
+        """Track token usage and cost from the provider-reported counts"""
+        tokens = usage.prompt_tokens + usage.completion_tokens
+        self.total_tokens += tokens
+        self.cached_tokens += usage.cache_read_input_tokens
+        if usage.first_token_latency:
+            self.first_token_latencies.append(usage.first_token_latency)
+
+        if usage.cost:
+            self.total_cost += usage.cost
+            return
+        rates = self._manager_rates if client is self.manager else self._developer_rates
+        self.total_cost += self._estimate_cost(tokens, rates, usage.cache_read_input_tokens)
 
     def _check_budget_limits(self) -> tuple[bool, str]:
         """Check if budget limits exceeded"""
@@ -192,21 +600,97 @@ class CollaborationWorkflow:
             return True, "max_cost"
         return False, ""
 
+    def _budget_stop(self) -> str:
+        """Report and return the exceeded budget limit, or an empty string"""
+        exceeded, reason = self._check_budget_limits()
+        if exceeded:
+            self._print(f"\n[red]⚠ Budget limit exceeded: {reason}[/red]")
+        return reason if exceeded else ""
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
         if not text1 or not text2:
             return 0.0
-        return SequenceMatcher(None, text1, text2).ratio()
+        if text1 == text2:
+            return 1.0
+        if _fast_ratio is not None:
+            return _fast_ratio(text1, text2)
+
+        # autojunk=False matches difflib_fast and suits small-alphabet code/text.
+        # Consecutive checks share a text (this check's text2 is the next one's text1),
+        # so when it is still indexed as seq2 only the other side needs setting
+        matcher = self._matcher
+        if matcher.b == text1:
+            matcher.set_seq1(text2)
+        else:
+            matcher.set_seq2(text2)
+            matcher.set_seq1(text1)
+        return matcher.ratio()
+
+    def compute_progress_batch(self, pairs: list[tuple[str, str]], threads: int = 0) -> list[float]:
+        """Similarity of many (previous, current) submission pairs, as _check_progress scores them.
+
+        Identical texts score 1.0; everything else compares the similarity_window
+        head/tail windows. For drivers running many workflows side by side: with
+        difflib-fast the remaining pairs are scored across cores (threads=0 uses all)
+        with the GIL released. Feed each result back through
+        _check_progress(current, similarity=...).
+        """
+        ratios = [1.0 if a == b else None for a, b in pairs]
+        pending = [i for i, ratio in enumerate(ratios) if ratio is None]
+        pruned = [(self._prune(pairs[i][0]), self._prune(pairs[i][1])) for i in pending]
+        if _fast_ratio is not None:
+            scores = _fast_ratio(pruned, threads=threads)
+        else:
+            scores = [SequenceMatcher(None, a, b, autojunk=False).ratio() for a, b in pruned]
+        for i, (a, b), score in zip(pending, pruned, scores):
+            ratios[i] = 0.0 if not a or not b else score
+        return ratios
+
+    def _prune(self, text: str) -> str:
+        """Head and tail of text, bounding similarity work regardless of response size"""
+        k = self.similarity_window
+        if not k or len(text) <= 2 * k:
+            return text
+        return text[:k] + text[-k:]
+
+    def _may_be_similar(self, previous: str, current: str) -> bool:
+        """Cheap upper bounds on the similarity ratio (lengths, then character counts)"""
+        total = len(previous) + len(current)
+        # Same bounds as SequenceMatcher.real_quick_ratio() and quick_ratio()
+        if total and 2.0 * min(len(previous), len(current)) / total < self.early_stop_similarity:
+            self._previous_counts = None  # Built lazily if the next check needs them
+            return False
+
+        # The previous submission's counts were built when it was the current one
+        previous_counts = self._previous_counts or Counter(previous)
+        self._previous_counts = Counter(current)
+        if not total:
+            return True
+        matches = sum((previous_counts & self._previous_counts).values())
+        return 2.0 * matches / total >= self.early_stop_similarity
 
-    def _check_progress(self, current_submission: str) -> bool:
-        """Check if there's meaningful progress"""
+    def _check_progress(self, current_submission: str, similarity: float = None) -> bool:
+        """Check if there's meaningful progress (similarity: precomputed, e.g. by compute_progress_batch)"""
         if self.previous_submission_text is None:
             self.previous_submission_text = current_submission
             return True
 
-        similarity = self._calculate_similarity(self.previous_submission_text, current_submission)
+        previous = self.previous_submission_text
+        if similarity is not None:
+            similar = similarity >= self.early_stop_similarity
+            self._previous_counts = None  # No longer describe the new previous submission
+        else:
+            # Verbatim repeats are common and need no ratio math; str equality checks
+            # identity and length before comparing contents (counts stay valid too)
+            # Everything past that compares pruned windows (_previous_counts are of windows too)
+            pruned_previous, pruned_current = self._prune(previous), self._prune(current_submission)
+            similar = current_submission == previous or (
+                self._may_be_similar(pruned_previous, pruned_current)
+                and self._calculate_similarity(pruned_previous, pruned_current) >= self.early_stop_similarity
+            )
 
-        if similarity >= self.early_stop_similarity:
+        if similar:
             self.no_progress_count += 1
         else:
             self.no_progress_count = 0
@@ -214,58 +698,382 @@ class CollaborationWorkflow:
         self.previous_submission_text = current_submission
         return self.no_progress_count < self.max_no_progress
 
+    @staticmethod
+    def _submission_diff(base: str, current: str) -> str:
+        """Unified diff of two submissions, marking a missing final newline like diff(1)"""
+        lines = unified_diff(base.splitlines(keepends=True), current.splitlines(keepends=True), "base", "previous")
+        # A last line without "\n" would otherwise run into the next diff line
+        return "".join(
+            line if line.endswith("\n") else line + "\n\\ No newline at end of file\n" for line in lines
+        )
+
+    def _revision_messages(self, requirements: str, previous_submission: str, feedback: str) -> list[Message]:
+        """Revision prompt with the last full submission in the cached header and only a diff after it.
+
+        The current submission becomes the new base (sent in full) when the diff would
+        not be smaller than revise_diff_ratio of it.
+        """
+        if not self.revise_diff_ratio:
+            return cacheable_user(
+                render_revise_header(requirements=requirements),
+                render_revise_tail(previous_submission=previous_submission, feedback=feedback),
+            )
+
+        diff = ""
+        if self._last_sent_submission is not None:
+            diff = self._submission_diff(self._last_sent_submission, previous_submission)
+        if self._last_sent_submission is None or len(diff) >= self.revise_diff_ratio * len(previous_submission):
+            self._last_sent_submission = previous_submission
+            self._last_sent_header = render_revise_diff_header(
+                requirements=requirements, base_submission=previous_submission
+            )
+            diff = ""
+        return cacheable_user(
+            self._last_sent_header,
+            render_revise_diff_tail(diff=diff or "(변경 없음)", feedback=feedback),
+        )
+
+    def _checkpoint_due(self, iterations: int) -> bool:
+        return bool(self.checkpoint_interval) and iterations % self.checkpoint_interval == 0
+
     def _user_checkpoint(self, iterations: int) -> bool:
         """Ask user if they want to continue"""
-        if self.checkpoint_interval and iterations % self.checkpoint_interval == 0:
-            self.console.print(f"\n[yellow]━━━ Checkpoint at iteration {iterations} ━━━[/yellow]")
-            self.console.print(f"[dim]Tokens used: {self.total_tokens:,} / {self.max_tokens:,}[/dim]")
-            self.console.print(f"[dim]Estimated cost: ${self.total_cost:.4f} / ${self.max_cost:.2f}[/dim]")
+        if self._checkpoint_due(iterations):
+            self._print(f"\n[yellow]━━━ Checkpoint at iteration {iterations} ━━━[/yellow]")
+            self._print(f"[dim]Tokens used: {self.total_tokens:,} / {self.max_tokens:,}[/dim]")
+            self._print(f"[dim]Estimated cost: ${self.total_cost:.4f} / ${self.max_cost:.2f}[/dim]")
 
+            self._flush_console()
             return Confirm.ask("\nContinue workflow?", default=True)
         return True
 
+    def _checkpoint_chat(
+        self,
+        iterations: int,
+        client: AIClient,
+        messages: list[Message],
+        system_prompt: str,
+        stop_marker: str = None,
+        semantic: bool = False,
+    ) -> tuple[str, Usage] | None:
+        """User checkpoint that starts the iteration's call while the prompt waits.
+
+        Returns the call's result, or None if the user stopped. A declined call is
+        aborted at its next streamed chunk, so one still waiting for its first token
+        holds the request open until then; the stop does not wait for it, and only
+        the usage collected so far is tracked.
+        """
+        if not self._checkpoint_due(iterations):
+            return self._chat(client, messages, system_prompt=system_prompt, stop_marker=stop_marker, semantic=semantic)
+
+        if self._speculative_executor is None:
+            self._speculative_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculative")
+        cancel, usage = threading.Event(), Usage()
+        future = self._speculative_executor.submit(
+            self._chat_cancellable, client, messages, system_prompt, stop_marker, cancel, semantic, usage
+        )
+        if self._user_checkpoint(iterations):
+            return future.result()
+
+        cancel.set()
+        if future.done() and future.exception() is None:
+            _, usage = future.result()  # Finished during the prompt (a cache hit reports nothing)
+        # An API error from a call the user declined doesn't matter any more
+        self._track_usage(client, replace(usage))
+        return None
+
+    async def _checkpoint_chat_async(
+        self, iterations: int, client: AIClient, messages: list[Message], system_prompt: str, stop_marker: str = None
+    ) -> tuple[str, Usage] | None:
+        """Async variant of _checkpoint_chat; the prompt runs in a thread so the call proceeds"""
+        usage = Usage()
+        task = asyncio.ensure_future(
+            self._chat_async(client, messages, system_prompt=system_prompt, stop_marker=stop_marker, usage=usage)
+        )
+        if not self._checkpoint_due(iterations) or await asyncio.to_thread(self._user_checkpoint, iterations):
+            return await task
+
+        if task.done():
+            _, usage = task.result()
+        else:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # Whatever the declined call used so far is still tracked, as in _checkpoint_chat
+        self._track_usage(client, usage)
+        return None
+
+    def _chat_cancellable(
+        self,
+        client: AIClient,
+        messages: list[Message],
+        system_prompt: str,
+        stop_marker: str,
+        cancel: threading.Event,
+        semantic: bool = False,
+        usage: Usage = None,
+    ) -> tuple[str, Usage]:
+        """Like _chat, but streams quietly and stops reading once cancel is set; usage fills in place"""
+        cached = self._cached_response(client, messages, system_prompt, semantic)
+        if cached is not None:
+            return cached
+
+        parts, usage = [], usage if usage is not None else Usage()
+        stream = client.stream_chat(messages, system_prompt, stop_marker, usage)
+        try:
+            for delta in stream:
+                if cancel.is_set():
+                    break
+                parts.append(delta)
+        finally:
+            # Closing the generator closes the underlying HTTP response
+            stream.close()
+        text = "".join(parts)
+        if not cancel.is_set():
+            self._store_response(client, messages, system_prompt, text, usage, semantic)
+        return text, usage
+
     def _display_budget_status(self):
         """Display current budget status"""
         token_pct = (self.total_tokens / self.max_tokens * 100) if self.max_tokens else 0
         cost_pct = (self.total_cost / self.max_cost * 100) if self.max_cost else 0
 
-        status = f"[dim]Budget: {self.total_tokens:,}/{self.max_tokens:,} tokens ({token_pct:.1f}%) | ${self.total_cost:.4f}/${self.max_cost:.2f} ({cost_pct:.1f}%)[/dim]"
-        self.console.print(status)
+        status = f"[dim]Budget: {self.total_tokens:,}/{self.max_tokens:,} tokens ({token_pct:.1f}%) | ${self.total_cost:.4f}/${self.max_cost:.2f} ({cost_pct:.1f}%)"
+        if self.cached_tokens:
+            status += f" | Cache hits: {self.cached_tokens:,} tokens"
+        if self.replayed_responses:
+            status += f" | Replayed: {self.replayed_responses} responses ({self.replayed_tokens:,} tokens, not billed)"
+        if self.first_token_latencies:
+            avg_ttft = sum(self.first_token_latencies) / len(self.first_token_latencies)
+            status += f" | Avg first token: {avg_ttft:.2f}s"
+        status += "[/dim]"
+        self._print(status)
+
+    def _print_replay_stats(self):
+        if self.replayed_responses:
+            self._print(
+                f"  Replayed from cache: {self.replayed_responses} responses "
+                f"({self.replayed_tokens:,} tokens, not included above)"
+            )
+
+    def run_development(self, requirements: str, resume: bool = False, resume_log: str = None) -> WorkflowResult:
+        """Run a full development workflow.
 
-    def run_development(self, requirements: str) -> WorkflowResult:
-        """Run a full development workflow"""
-        self.conversation_history = []
-        self.total_tokens = 0
-        self.total_cost = 0.0
-        self.no_progress_count = 0
-        self.previous_submission_text = None
+        resume=True continues from the last checkpoint for these requirements;
+        resume_log continues from a run log (e.g. an interrupted run_*.jsonl.tmp).
+        """
+        self._reset_run_state()
+        current_phase = WorkflowPhase.PLANNING
+        stopped_reason = ""
+
+        checkpoint_path = self._checkpoint_path(requirements)
+        if resume_log:
+            checkpoint = self.resume_from(resume_log)
+        else:
+            checkpoint = self._load_checkpoint(checkpoint_path) if resume else None
+
+        if checkpoint:
+            iterations = checkpoint["iterations"]
+            previous_submission = checkpoint["previous_submission"]
+            manager_feedback = checkpoint["manager_feedback"]
+            self._display_message("system", f"Resuming development workflow after iteration {iterations} (Mode: {self.budget_mode})...", "start")
+        else:
+            self._display_message("system", f"Starting development workflow (Mode: {self.budget_mode})...\n\n**Requirements:**\n{requirements}", "start")
+
+            # Phase 1: Developer creates initial plan
+            plan_prompt = render_plan(requirements=requirements)
+            developer_plan, usage = self._chat(
+                self.developer,
+                [Message(role="user", content=plan_prompt)],
+                system_prompt=DEVELOPER_SYSTEM_PROMPT,
+                semantic=True,
+            )
+            self._track_usage(self.developer, usage)
+            self._add_turn("developer", developer_plan, current_phase)
+
+            # Phase 2: Manager reviews plan
+            review_header = render_planning_header(requirements=requirements)
+            review_tail = render_planning_tail(plan=developer_plan)
+            manager_feedback, usage = self._chat(
+                self.manager,
+                cacheable_user(review_header, review_tail),
+                system_prompt=MANAGER_SYSTEM_PROMPT,
+            )
+            self._track_usage(self.manager, usage)
+            self._add_turn("manager", manager_feedback, current_phase)
+
+            previous_submission = developer_plan
+            iterations = 0
+            self._save_checkpoint(checkpoint_path, iterations, previous_submission, manager_feedback, current_phase)
+
+        # Phase 3: Implementation loop
+        current_phase = WorkflowPhase.IMPLEMENTATION
+        # Prompt headers depend only on the requirements, so render them once per run
+        implement_header = render_implement_header(requirements=requirements)
+        impl_review_header = render_review_header(task_type="implementation", requirements=requirements)
+
+        while iterations < self.max_iterations:
+            iterations += 1
+            self._display_budget_status()
+
+            # Check budget limits
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
+            # Developer implements/revises
+            if iterations == 1:
+                impl_messages = cacheable_user(implement_header, render_implement_tail(instructions=manager_feedback))
+            else:
+                impl_messages = self._revision_messages(requirements, previous_submission, manager_feedback)
+
+            # User checkpoint; the developer call starts while the prompt waits
+            reply = self._checkpoint_chat(
+                iterations,
+                self.developer,
+                impl_messages,
+                system_prompt=DEVELOPER_SYSTEM_PROMPT,
+            )
+            if reply is None:
+                stopped_reason = "user_stopped"
+                self._print("\n[yellow]Workflow stopped by user[/yellow]")
+                break
+            developer_response, usage = reply
+            self._track_usage(self.developer, usage)
+            self._add_turn("developer", developer_response, current_phase)
+            previous_submission = developer_response
+
+            # Check progress
+            if not self._check_progress(developer_response):
+                stopped_reason = "no_progress"
+                self._print(f"\n[yellow]⚠ No meaningful progress detected for {self.max_no_progress} iterations. Stopping.[/yellow]")
+                break
+
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
+            # Manager reviews
+            current_phase = WorkflowPhase.REVIEW
+            review_tail = render_review_tail(submission=developer_response)
+            manager_feedback, usage = self._chat(
+                self.manager,
+                cacheable_user(impl_review_header, review_tail),
+                system_prompt=MANAGER_SYSTEM_PROMPT,
+                stop_marker=APPROVAL_MARKER,
+            )
+            self._track_usage(self.manager, usage)
+            self._add_turn("manager", manager_feedback, current_phase)
+
+            if self._check_approval(manager_feedback):
+                current_phase = WorkflowPhase.APPROVED
+                stopped_reason = "approved"
+                break
+
+            current_phase = WorkflowPhase.IMPLEMENTATION
+            self._save_checkpoint(checkpoint_path, iterations, previous_submission, manager_feedback, current_phase)
+
+        if not stopped_reason:
+            stopped_reason = "max_iterations"
+
+        # An approved run has nothing left to resume
+        if current_phase == WorkflowPhase.APPROVED and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        # Display final stats
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations}")
+        self._print(f"  Total tokens: {self.total_tokens:,}")
+        self._print(f"  Estimated cost: ${self.total_cost:.4f}")
+        self._print(f"  Stop reason: {stopped_reason}")
+        self._print_replay_stats()
+
+        # Save results
+        self._close_run_log()
+        self._save_result(requirements, previous_submission)
+
+        self._flush_console()
+        return WorkflowResult(
+            success=current_phase == WorkflowPhase.APPROVED,
+            final_output=previous_submission,
+            conversation_history=list(self.conversation_history),
+            iterations=iterations,
+            phase=current_phase,
+            total_tokens=self.total_tokens,
+            total_cost=self.total_cost,
+            stopped_reason=stopped_reason,
+        )
+
+    async def _run_critics_async(self, task_type: str, requirements: str, submission: str) -> tuple[str, bool]:
+        """Run independent manager critics concurrently and merge their feedback"""
+        review_header = render_review_header(task_type=task_type, requirements=requirements)
+        review_tail = render_review_tail(submission=submission)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_reviews)
+
+        async def critic(aspect: str) -> tuple[str, Usage]:
+            async with semaphore:
+                started = time.perf_counter()
+                result = await self._chat_async(
+                    self.manager,
+                    cacheable_user(review_header, review_tail + MANAGER_CRITIC_PROMPTS[aspect]),
+                    system_prompt=MANAGER_SYSTEM_PROMPT,
+                    stop_marker=APPROVAL_MARKER,
+                )
+                self.critic_latencies.append((aspect, time.perf_counter() - started))
+                return result
+
+        aspects = list(MANAGER_CRITIC_PROMPTS)
+        results = await asyncio.gather(*[critic(aspect) for aspect in aspects])
+        self._print("[dim]Critic latency: " + ", ".join(
+            f"{aspect} {seconds:.1f}s" for aspect, seconds in self.critic_latencies[-len(aspects):]
+        ) + "[/dim]")
+
+        sections = []
+        approved = True
+        for aspect, (critique, usage) in zip(aspects, results):
+            self._track_usage(self.manager, usage)
+            # Every critic has to approve, otherwise the merged feedback goes back to the developer
+            approved = approved and self._check_approval(critique)
+            sections.append(f"## {aspect.title()} Review\n\n{critique}")
+
+        return "\n\n".join(sections), approved
+
+    async def run_development_async(self, requirements: str) -> WorkflowResult:
+        """Run a development workflow where parallel critics review each submission"""
+        self._reset_run_state()
         current_phase = WorkflowPhase.PLANNING
         stopped_reason = ""
 
-        self._display_message("system", f"Starting development workflow (Mode: {self.budget_mode})...\n\n**Requirements:**\n{requirements}", "start")
+        self._display_message("system", f"Starting development workflow with parallel review (Mode: {self.budget_mode})...\n\n**Requirements:**\n{requirements}", "start")
 
         # Phase 1: Developer creates initial plan
-        plan_prompt = DEVELOPER_PLAN_PROMPT.format(requirements=requirements)
-        developer_plan = self.developer.chat(
+        plan_prompt = render_plan(requirements=requirements)
+        developer_plan, usage = await self._chat_async(
+            self.developer,
             [Message(role="user", content=plan_prompt)],
             system_prompt=DEVELOPER_SYSTEM_PROMPT,
+            semantic=True,
         )
-        self._track_usage(plan_prompt + developer_plan, self.developer)
+        self._track_usage(self.developer, usage)
         self._add_turn("developer", developer_plan, current_phase)
 
         # Phase 2: Manager reviews plan
-        review_prompt = MANAGER_PLANNING_PROMPT.format(
-            requirements=requirements, plan=developer_plan
-        )
-        manager_feedback = self.manager.chat(
-            [Message(role="user", content=review_prompt)],
+        review_header = render_planning_header(requirements=requirements)
+        review_tail = render_planning_tail(plan=developer_plan)
+        manager_feedback, usage = await self._chat_async(
+            self.manager,
+            cacheable_user(review_header, review_tail),
             system_prompt=MANAGER_SYSTEM_PROMPT,
         )
-        self._track_usage(review_prompt + manager_feedback, self.manager)
+        self._track_usage(self.manager, usage)
         self._add_turn("manager", manager_feedback, current_phase)
 
         # Phase 3: Implementation loop
         current_phase = WorkflowPhase.IMPLEMENTATION
+        # The implement header depends only on the requirements, so render it once per run
+        implement_header = render_implement_header(requirements=requirements)
         previous_submission = developer_plan
         iterations = 0
 
@@ -274,59 +1082,51 @@ class CollaborationWorkflow:
             self._display_budget_status()
 
             # Check budget limits
-            exceeded, reason = self._check_budget_limits()
-            if exceeded:
-                stopped_reason = reason
-                self.console.print(f"\n[red]⚠ Budget limit exceeded: {reason}[/red]")
-                break
-
-            # User checkpoint
-            if not self._user_checkpoint(iterations):
-                stopped_reason = "user_stopped"
-                self.console.print("\n[yellow]Workflow stopped by user[/yellow]")
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
                 break
 
             # Developer implements/revises
             if iterations == 1:
-                impl_prompt = DEVELOPER_IMPLEMENT_PROMPT.format(
-                    requirements=requirements, instructions=manager_feedback
-                )
+                impl_messages = cacheable_user(implement_header, render_implement_tail(instructions=manager_feedback))
             else:
-                impl_prompt = DEVELOPER_REVISE_PROMPT.format(
-                    requirements=requirements,
-                    previous_submission=previous_submission,
-                    feedback=manager_feedback,
-                )
+                impl_messages = self._revision_messages(requirements, previous_submission, manager_feedback)
 
-            developer_response = self.developer.chat(
-                [Message(role="user", content=impl_prompt)],
+            # User checkpoint; the developer call starts while the prompt waits
+            reply = await self._checkpoint_chat_async(
+                iterations,
+                self.developer,
+                impl_messages,
                 system_prompt=DEVELOPER_SYSTEM_PROMPT,
             )
-            self._track_usage(impl_prompt + developer_response, self.developer)
+            if reply is None:
+                stopped_reason = "user_stopped"
+                self._print("\n[yellow]Workflow stopped by user[/yellow]")
+                break
+            developer_response, usage = reply
+            self._track_usage(self.developer, usage)
             self._add_turn("developer", developer_response, current_phase)
             previous_submission = developer_response
 
             # Check progress
             if not self._check_progress(developer_response):
                 stopped_reason = "no_progress"
-                self.console.print(f"\n[yellow]⚠ No meaningful progress detected for {self.max_no_progress} iterations. Stopping.[/yellow]")
+                self._print(f"\n[yellow]⚠ No meaningful progress detected for {self.max_no_progress} iterations. Stopping.[/yellow]")
                 break
 
-            # Manager reviews
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
+            # Critics review in parallel
             current_phase = WorkflowPhase.REVIEW
-            review_prompt = MANAGER_REVIEW_PROMPT.format(
-                task_type="implementation",
-                requirements=requirements,
-                submission=developer_response,
-            )
-            manager_feedback = self.manager.chat(
-                [Message(role="user", content=review_prompt)],
-                system_prompt=MANAGER_SYSTEM_PROMPT,
+            manager_feedback, approved = await self._run_critics_async(
+                "implementation", requirements, developer_response
             )
-            self._track_usage(review_prompt + manager_feedback, self.manager)
             self._add_turn("manager", manager_feedback, current_phase)
 
-            if self._check_approval(manager_feedback):
+            if approved:
                 current_phase = WorkflowPhase.APPROVED
                 stopped_reason = "approved"
                 break
@@ -337,19 +1137,22 @@ class CollaborationWorkflow:
             stopped_reason = "max_iterations"
 
         # Display final stats
-        self.console.print(f"\n[bold]Final Statistics:[/bold]")
-        self.console.print(f"  Iterations: {iterations}")
-        self.console.print(f"  Total tokens: {self.total_tokens:,}")
-        self.console.print(f"  Estimated cost: ${self.total_cost:.4f}")
-        self.console.print(f"  Stop reason: {stopped_reason}")
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations}")
+        self._print(f"  Total tokens: {self.total_tokens:,}")
+        self._print(f"  Estimated cost: ${self.total_cost:.4f}")
+        self._print(f"  Stop reason: {stopped_reason}")
+        self._print_replay_stats()
 
         # Save results
+        self._close_run_log()
         self._save_result(requirements, previous_submission)
 
+        self._flush_console()
         return WorkflowResult(
             success=current_phase == WorkflowPhase.APPROVED,
             final_output=previous_submission,
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             iterations=iterations,
             phase=current_phase,
             total_tokens=self.total_tokens,
@@ -359,11 +1162,7 @@ class CollaborationWorkflow:
 
     def run_review(self, code: str, context: str = "") -> WorkflowResult:
         """Run a code review workflow"""
-        self.conversation_history = []
-        self.total_tokens = 0
-        self.total_cost = 0.0
-        self.no_progress_count = 0
-        self.previous_submission_text = None
+        self._reset_run_state()
         current_phase = WorkflowPhase.REVIEW
         stopped_reason = ""
 
@@ -374,34 +1173,141 @@ class CollaborationWorkflow:
         self._display_message("system", f"Starting code review (Mode: {self.budget_mode})...", "start")
 
         # Manager does initial review
-        manager_review = self.manager.chat(
+        manager_review, usage = self._chat(
+            self.manager,
             [Message(role="user", content=review_request)],
             system_prompt=MANAGER_SYSTEM_PROMPT,
+            semantic=True,
+        )
+        self._track_usage(self.manager, usage)
+        self._add_turn("manager", manager_review, current_phase)
+
+        # Developer responds with improvements
+        dev_prompt = f"PM의 코드 리뷰 피드백입니다:\n\n{manager_review}\n\n원본 코드:\n{code}\n\n피드백을 반영하여 개선된 코드를 제출해주세요."
+        developer_response, usage = self._chat(
+            self.developer,
+            [Message(role="user", content=dev_prompt)],
+            system_prompt=DEVELOPER_SYSTEM_PROMPT,
+        )
+        self._track_usage(self.developer, usage)
+        self._add_turn("developer", developer_response, current_phase)
+
+        iterations = 1
+        previous_submission = developer_response
+        # The first revision is the baseline the loop's revisions are compared against
+        self.previous_submission_text = developer_response
+
+        while iterations < self.max_iterations:
+            iterations += 1
+            self._display_budget_status()
+
+            # Check budget limits
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
+            # User checkpoint; the manager re-review starts while the prompt waits
+            review_prompt = f"개발자가 수정한 코드를 다시 검토해주세요:\n\n{previous_submission}"
+            reply = self._checkpoint_chat(
+                iterations,
+                self.manager,
+                [Message(role="user", content=review_prompt)],
+                system_prompt=MANAGER_SYSTEM_PROMPT,
+                stop_marker=APPROVAL_MARKER,
+            )
+            if reply is None:
+                stopped_reason = "user_stopped"
+                break
+            final_review, usage = reply
+            self._track_usage(self.manager, usage)
+            self._add_turn("manager", final_review, current_phase)
+
+            if self._check_approval(final_review):
+                current_phase = WorkflowPhase.APPROVED
+                stopped_reason = "approved"
+                break
+
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
+            # Developer revises again
+            dev_revise = f"PM의 추가 피드백을 반영하여 다시 수정해주세요.\n\n피드백:\n{final_review}\n\n이전 제출물:\n{previous_submission}"
+            developer_response, usage = self._chat(
+                self.developer,
+                [Message(role="user", content=dev_revise)],
+                system_prompt=DEVELOPER_SYSTEM_PROMPT,
+            )
+            self._track_usage(self.developer, usage)
+            self._add_turn("developer", developer_response, current_phase)
+
+            # Check progress
+            if not self._check_progress(developer_response):
+                stopped_reason = "no_progress"
+                self._print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
+                break
+
+            previous_submission = developer_response
+
+        if not stopped_reason:
+            stopped_reason = "max_iterations"
+
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print_replay_stats()
+
+        self._close_run_log()
+
+        self._flush_console()
+        return WorkflowResult(
+            success=current_phase == WorkflowPhase.APPROVED,
+            final_output=previous_submission,
+            conversation_history=list(self.conversation_history),
+            iterations=iterations,
+            phase=current_phase,
+            total_tokens=self.total_tokens,
+            total_cost=self.total_cost,
+            stopped_reason=stopped_reason,
         )
-        self._track_usage(review_request + manager_review, self.manager)
+
+    async def run_review_async(self, code: str, context: str = "") -> WorkflowResult:
+        """Run a code review workflow where parallel critics review each revision"""
+        self._reset_run_state()
+        current_phase = WorkflowPhase.REVIEW
+        stopped_reason = ""
+
+        # The critics' shared header carries the review goal; the code itself goes in the tail
+        review_goal = context or "기존 코드의 품질 검토 및 개선"
+
+        self._display_message("system", f"Starting code review with parallel critics (Mode: {self.budget_mode})...", "start")
+
+        # Critics do the initial review
+        manager_review, _ = await self._run_critics_async("code", review_goal, code)
         self._add_turn("manager", manager_review, current_phase)
 
         # Developer responds with improvements
         dev_prompt = f"PM의 코드 리뷰 피드백입니다:\n\n{manager_review}\n\n원본 코드:\n{code}\n\n피드백을 반영하여 개선된 코드를 제출해주세요."
-        developer_response = self.developer.chat(
+        developer_response, usage = await self._chat_async(
+            self.developer,
             [Message(role="user", content=dev_prompt)],
             system_prompt=DEVELOPER_SYSTEM_PROMPT,
         )
-        self._track_usage(dev_prompt + developer_response, self.developer)
+        self._track_usage(self.developer, usage)
         self._add_turn("developer", developer_response, current_phase)
 
         iterations = 1
         previous_submission = developer_response
+        # The first revision is the baseline the loop's revisions are compared against
+        self.previous_submission_text = developer_response
 
         while iterations < self.max_iterations:
             iterations += 1
             self._display_budget_status()
 
             # Check budget limits
-            exceeded, reason = self._check_budget_limits()
-            if exceeded:
-                stopped_reason = reason
-                self.console.print(f"\n[red]⚠ Budget limit exceeded: {reason}[/red]")
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
                 break
 
             # User checkpoint
@@ -409,33 +1315,34 @@ class CollaborationWorkflow:
                 stopped_reason = "user_stopped"
                 break
 
-            # Manager re-reviews
-            review_prompt = f"개발자가 수정한 코드입니다:\n\n{previous_submission}\n\n다시 검토해주세요."
-            final_review = self.manager.chat(
-                [Message(role="user", content=review_prompt)],
-                system_prompt=MANAGER_SYSTEM_PROMPT,
-            )
-            self._track_usage(review_prompt + final_review, self.manager)
+            # Critics re-review in parallel
+            final_review, approved = await self._run_critics_async("code", review_goal, previous_submission)
             self._add_turn("manager", final_review, current_phase)
 
-            if self._check_approval(final_review):
+            if approved:
                 current_phase = WorkflowPhase.APPROVED
                 stopped_reason = "approved"
                 break
 
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
             # Developer revises again
-            dev_revise = f"PM의 추가 피드백:\n\n{final_review}\n\n이전 제출물:\n{previous_submission}\n\n다시 수정해주세요."
-            developer_response = self.developer.chat(
+            dev_revise = f"PM의 추가 피드백을 반영하여 다시 수정해주세요.\n\n피드백:\n{final_review}\n\n이전 제출물:\n{previous_submission}"
+            developer_response, usage = await self._chat_async(
+                self.developer,
                 [Message(role="user", content=dev_revise)],
                 system_prompt=DEVELOPER_SYSTEM_PROMPT,
             )
-            self._track_usage(dev_revise + developer_response, self.developer)
+            self._track_usage(self.developer, usage)
             self._add_turn("developer", developer_response, current_phase)
 
             # Check progress
             if not self._check_progress(developer_response):
                 stopped_reason = "no_progress"
-                self.console.print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
+                self._print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
                 break
 
             previous_submission = developer_response
@@ -443,13 +1350,17 @@ class CollaborationWorkflow:
         if not stopped_reason:
             stopped_reason = "max_iterations"
 
-        self.console.print(f"\n[bold]Final Statistics:[/bold]")
-        self.console.print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print_replay_stats()
 
+        self._close_run_log()
+
+        self._flush_console()
         return WorkflowResult(
             success=current_phase == WorkflowPhase.APPROVED,
             final_output=previous_submission,
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             iterations=iterations,
             phase=current_phase,
             total_tokens=self.total_tokens,
@@ -459,11 +1370,7 @@ class CollaborationWorkflow:
 
     def run_planning(self, project_description: str) -> WorkflowResult:
         """Run a project planning workflow"""
-        self.conversation_history = []
-        self.total_tokens = 0
-        self.total_cost = 0.0
-        self.no_progress_count = 0
-        self.previous_submission_text = None
+        self._reset_run_state()
         current_phase = WorkflowPhase.PLANNING
         stopped_reason = ""
 
@@ -472,52 +1379,61 @@ class CollaborationWorkflow:
         iterations = 0
         previous_plan = ""
 
+        # The plan review header only depends on the project description
+        review_header = render_planning_header(requirements=project_description)
+
         while iterations < self.max_iterations:
             iterations += 1
             self._display_budget_status()
 
             # Check budget limits
-            exceeded, reason = self._check_budget_limits()
-            if exceeded:
-                stopped_reason = reason
-                self.console.print(f"\n[red]⚠ Budget limit exceeded: {reason}[/red]")
-                break
-
-            # User checkpoint
-            if not self._user_checkpoint(iterations):
-                stopped_reason = "user_stopped"
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
                 break
 
             # Developer creates/revises plan
             if iterations == 1:
-                plan_prompt = DEVELOPER_PLAN_PROMPT.format(requirements=project_description)
+                plan_prompt = render_plan(requirements=project_description)
             else:
                 plan_prompt = f"PM 피드백을 반영하여 계획을 수정해주세요:\n\n피드백:\n{manager_feedback}\n\n이전 계획:\n{previous_plan}"
 
-            developer_plan = self.developer.chat(
+            # User checkpoint; the developer call starts while the prompt waits
+            reply = self._checkpoint_chat(
+                iterations,
+                self.developer,
                 [Message(role="user", content=plan_prompt)],
                 system_prompt=DEVELOPER_SYSTEM_PROMPT,
+                semantic=iterations == 1,
             )
-            self._track_usage(plan_prompt + developer_plan, self.developer)
+            if reply is None:
+                stopped_reason = "user_stopped"
+                break
+            developer_plan, usage = reply
+            self._track_usage(self.developer, usage)
             self._add_turn("developer", developer_plan, current_phase)
 
             # Check progress
             if not self._check_progress(developer_plan):
                 stopped_reason = "no_progress"
-                self.console.print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
+                self._print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
                 break
 
             previous_plan = developer_plan
 
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
             # Manager reviews plan
-            review_prompt = MANAGER_PLANNING_PROMPT.format(
-                requirements=project_description, plan=developer_plan
-            )
-            manager_feedback = self.manager.chat(
-                [Message(role="user", content=review_prompt)],
+            review_tail = render_planning_tail(plan=developer_plan)
+            manager_feedback, usage = self._chat(
+                self.manager,
+                cacheable_user(review_header, review_tail),
                 system_prompt=MANAGER_SYSTEM_PROMPT,
+                stop_marker=APPROVAL_MARKER,
             )
-            self._track_usage(review_prompt + manager_feedback, self.manager)
+            self._track_usage(self.manager, usage)
             self._add_turn("manager", manager_feedback, current_phase)
 
             if self._check_approval(manager_feedback):
@@ -528,13 +1444,17 @@ class CollaborationWorkflow:
         if not stopped_reason:
             stopped_reason = "max_iterations"
 
-        self.console.print(f"\n[bold]Final Statistics:[/bold]")
-        self.console.print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print_replay_stats()
+
+        self._close_run_log()
 
+        self._flush_console()
         return WorkflowResult(
             success=current_phase == WorkflowPhase.APPROVED,
             final_output=previous_plan,
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             iterations=iterations,
             phase=current_phase,
             total_tokens=self.total_tokens,
@@ -544,11 +1464,7 @@ class CollaborationWorkflow:
 
     def run_documentation(self, topic: str, context: str = "") -> WorkflowResult:
         """Run a documentation workflow"""
-        self.conversation_history = []
-        self.total_tokens = 0
-        self.total_cost = 0.0
-        self.no_progress_count = 0
-        self.previous_submission_text = None
+        self._reset_run_state()
         current_phase = WorkflowPhase.IMPLEMENTATION
         stopped_reason = ""
 
@@ -561,55 +1477,62 @@ class CollaborationWorkflow:
         iterations = 0
         previous_doc = ""
 
+        review_header = f"다음 문서를 검토해주세요:\n\n주제: {topic}\n\n"
+
         while iterations < self.max_iterations:
             iterations += 1
             self._display_budget_status()
 
             # Check budget limits
-            exceeded, reason = self._check_budget_limits()
-            if exceeded:
-                stopped_reason = reason
-                self.console.print(f"\n[red]⚠ Budget limit exceeded: {reason}[/red]")
-                break
-
-            # User checkpoint
-            if not self._user_checkpoint(iterations):
-                stopped_reason = "user_stopped"
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
                 break
 
             # Developer writes/revises doc
             if iterations == 1:
-                developer_doc = self.developer.chat(
-                    [Message(role="user", content=doc_request)],
-                    system_prompt=DEVELOPER_SYSTEM_PROMPT + "\n\n문서 작성 시 명확하고 구조화된 형식을 사용하세요.",
-                )
-                self._track_usage(doc_request + developer_doc, self.developer)
+                doc_prompt = doc_request
             else:
-                doc_revise = f"PM 피드백을 반영하여 문서를 수정해주세요:\n\n피드백:\n{manager_feedback}\n\n이전 문서:\n{previous_doc}"
-                developer_doc = self.developer.chat(
-                    [Message(role="user", content=doc_revise)],
-                    system_prompt=DEVELOPER_SYSTEM_PROMPT,
-                )
-                self._track_usage(doc_revise + developer_doc, self.developer)
+                doc_prompt = f"PM 피드백을 반영하여 문서를 수정해주세요:\n\n피드백:\n{manager_feedback}\n\n이전 문서:\n{previous_doc}"
+
+            # User checkpoint; the developer call starts while the prompt waits
+            reply = self._checkpoint_chat(
+                iterations,
+                self.developer,
+                [Message(role="user", content=doc_prompt)],
+                system_prompt=DEVELOPER_DOC_SYSTEM_PROMPT,
+                semantic=iterations == 1,
+            )
+            if reply is None:
+                stopped_reason = "user_stopped"
+                break
+            developer_doc, usage = reply
+            self._track_usage(self.developer, usage)
 
             self._add_turn("developer", developer_doc, current_phase)
 
             # Check progress
             if not self._check_progress(developer_doc):
                 stopped_reason = "no_progress"
-                self.console.print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
+                self._print(f"\n[yellow]⚠ No meaningful progress for {self.max_no_progress} iterations.[/yellow]")
                 break
 
             previous_doc = developer_doc
 
+            # Stop before the next call if this turn used up the budget
+            stopped_reason = self._budget_stop()
+            if stopped_reason:
+                break
+
             # Manager reviews
             current_phase = WorkflowPhase.REVIEW
-            review_prompt = f"다음 문서를 검토해주세요:\n\n주제: {topic}\n\n문서:\n{developer_doc}"
-            manager_feedback = self.manager.chat(
-                [Message(role="user", content=review_prompt)],
+            review_tail = f"문서:\n{developer_doc}"
+            manager_feedback, usage = self._chat(
+                self.manager,
+                cacheable_user(review_header, review_tail),
                 system_prompt=MANAGER_SYSTEM_PROMPT,
+                stop_marker=APPROVAL_MARKER,
             )
-            self._track_usage(review_prompt + manager_feedback, self.manager)
+            self._track_usage(self.manager, usage)
             self._add_turn("manager", manager_feedback, current_phase)
 
             if self._check_approval(manager_feedback):
@@ -622,13 +1545,17 @@ class CollaborationWorkflow:
         if not stopped_reason:
             stopped_reason = "max_iterations"
 
-        self.console.print(f"\n[bold]Final Statistics:[/bold]")
-        self.console.print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print(f"\n[bold]Final Statistics:[/bold]")
+        self._print(f"  Iterations: {iterations} | Tokens: {self.total_tokens:,} | Cost: ${self.total_cost:.4f} | Reason: {stopped_reason}")
+        self._print_replay_stats()
+
+        self._close_run_log()
 
+        self._flush_console()
         return WorkflowResult(
             success=current_phase == WorkflowPhase.APPROVED,
             final_output=previous_doc,
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             iterations=iterations,
             phase=current_phase,
             total_tokens=self.total_tokens,
@@ -637,19 +1564,48 @@ class CollaborationWorkflow:
         )
 
     def _save_result(self, requirements: str, output: str):
-        """Save the result to a file"""
-        os.makedirs(self.output_dir, exist_ok=True)
+        """Save the result to a file (written on a background thread)"""
+        if not self._output_dir_created:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._output_dir_created = True
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join(self.output_dir, f"result_{timestamp}.md")
 
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(f"# AI Collaboration Result\n\n")
-            f.write(f"**Generated:** {datetime.now().isoformat()}\n\n")
-            f.write(f"## Requirements\n\n{requirements}\n\n")
-            f.write(f"## Final Output\n\n{output}\n\n")
-            f.write(f"## Conversation History\n\n")
-            for turn in self.conversation_history:
-                f.write(f"### {turn.role.upper()} ({turn.phase.value})\n\n")
-                f.write(f"{turn.content}\n\n---\n\n")
-
-        self.console.print(f"\n[dim]Result saved to: {filename}[/]")
+        header = "".join([
+            "# AI Collaboration Result\n\n",
+            f"**Generated:** {datetime.now().isoformat()}\n\n",
+            f"## Requirements\n\n{requirements}\n\n",
+            f"## Final Output\n\n{output}\n\n",
+            "## Conversation History\n\n",
+        ])
+
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1)
+        future = self._io_executor.submit(self._write_result, filename, header, self._log_path)
+        future.add_done_callback(lambda f: self._report_save_error(filename, f))
+        self._pending_saves.append(future)
+
+        self._print(f"\n[dim]Saving result to: {filename}[/]")
+
+    @staticmethod
+    def _write_result(filename: str, header: str, log_path: str):
+        """Write the markdown report, streaming the conversation from the run's JSONL log"""
+        # Pre-encoded bytes through a 1 MiB buffer: few syscalls, no text-layer encoding per write
+        with open(filename, "wb", buffering=1 << 20) as out, open(log_path, "rb") as log:
+            write = out.write
+            write(header.encode("utf-8"))
+            for line in log:
+                turn = json.loads(line)
+                write(f"### {turn['role'].upper()} ({turn['phase']})\n\n".encode("utf-8"))
+                write(turn["content"].encode("utf-8"))
+                write(b"\n\n---\n\n")
+
+    def _report_save_error(self, filename: str, future: Future):
+        if future.exception():
+            self.console.print(f"[red]Failed to save result to {filename}: {future.exception()}[/]")
+
+    def wait_for_saves(self):
+        """Block until background result writes have finished"""
+        for future in self._pending_saves:
+            future.exception()
+        self._pending_saves = []